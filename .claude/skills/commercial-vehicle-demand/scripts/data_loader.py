@@ -7,9 +7,21 @@ Uses passenger-vehicle style taxonomy structure
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 
+@lru_cache(maxsize=8)
+def _read_json(path: str) -> dict:
+    """
+    Parse a JSON data file once per process and share it across DataLoader instances
+
+    The returned dict is shared: callers must treat it as read-only.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class DataLoader:
     """Handles loading and accessing commercial vehicle forecasting data"""
 
@@ -32,34 +44,32 @@ class DataLoader:
 
     def _load_taxonomy(self) -> dict:
         """Load taxonomy and dataset mappings"""
-        taxonomy_path = os.path.join(
+        taxonomy_path = os.path.abspath(os.path.join(
             self.data_dir,
             "commercial_vehicle_taxonomy_and_datasets.json"
-        )
+        ))
 
         if not os.path.exists(taxonomy_path):
             raise FileNotFoundError(f"Taxonomy file not found: {taxonomy_path}")
 
-        with open(taxonomy_path, 'r') as f:
-            return json.load(f)
+        return _read_json(taxonomy_path)
 
     def _load_curves(self) -> dict:
         """Load all curves data (lazy loading)"""
         if self.curves_data is not None:
             return self.curves_data
 
-        curves_path = os.path.join(self.data_dir, "Commercial_Vehicle.json")
+        curves_path = os.path.abspath(os.path.join(self.data_dir, "Commercial_Vehicle.json"))
 
         if not os.path.exists(curves_path):
             print(f"Warning: Curves data file not found: {curves_path}")
             print("Data loader will work with taxonomy only (for structure validation)")
             return {}
 
-        with open(curves_path, 'r') as f:
-            data = json.load(f)
-            # Handle nested structure - extract "Commercial Vehicle" data
-            self.curves_data = data.get("Commercial Vehicle", data.get("Commercial_Vehicles", data))
-            return self.curves_data
+        data = _read_json(curves_path)
+        # Handle nested structure - extract "Commercial Vehicle" data
+        self.curves_data = data.get("Commercial Vehicle", data.get("Commercial_Vehicles", data))
+        return self.curves_data
 
     def _get_metric_name(self, entity: str, data_type: str, powertrain: Optional[str], region: str) -> Optional[str]:
         """
@@ -119,6 +129,9 @@ class DataLoader:
         if not year_sets:
             return [], []
 
+        # Year -> value lookups (avoids a linear list.index scan per year)
+        lookups = [dict(zip(years, values)) for years, values in series_list]
+
         common_years = sorted(set.intersection(*year_sets))
         if not common_years:
             # No common years, use union and fill missing with 0
@@ -126,10 +139,8 @@ class DataLoader:
             summed = []
             for year in all_years:
                 year_sum = 0.0
-                for years, values in series_list:
-                    if year in years:
-                        idx = years.index(year)
-                        year_sum += values[idx]
+                for lookup in lookups:
+                    year_sum += lookup.get(year, 0.0)
                 summed.append(year_sum)
             return all_years, summed
 
@@ -137,9 +148,8 @@ class DataLoader:
         summed = []
         for year in common_years:
             year_sum = 0.0
-            for years, values in series_list:
-                idx = years.index(year)
-                year_sum += values[idx]
+            for lookup in lookups:
+                year_sum += lookup[year]
             summed.append(year_sum)
 
         return common_years, summed
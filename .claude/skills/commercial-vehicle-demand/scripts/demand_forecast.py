@@ -8,8 +8,10 @@ Handles segment-level (LCV, MCV, HCV) demand forecasting with:
 """
 
 import numpy as np
+import pandas as pd
 from typing import Dict, Optional, Tuple
 from scipy.optimize import differential_evolution
+from scipy.special import expit
 from utils import linear_extrapolation, clamp_array, validate_forecast_consistency_three_powertrain
 from ngv_model import NGVModel
 
@@ -90,7 +92,7 @@ class DemandForecaster:
         Returns:
             Logistic curve values
         """
-        return L / (1 + np.exp(-k * (t - t0)))
+        return L * expit(k * (t - t0))
 
     def fit_logistic_curve(
         self,
@@ -121,6 +123,12 @@ class DemandForecaster:
             t0 = tipping_point if tipping_point else (years[0] if len(years) > 0 else 2025)
             return k, t0
 
+        # Negligible EV history: nothing to fit, skip the optimizer entirely
+        if np.max(shares) < 0.005:
+            k = 0.4
+            t0 = tipping_point if tipping_point else years[np.argmax(shares)]
+            return k, t0
+
         # Filter out zero or very small shares for better fitting
         mask = shares > 0.01
         if np.sum(mask) < 3:
@@ -221,13 +229,15 @@ class DemandForecaster:
         # Fit logistic curve to historical + pre-tipping data
         k, t0 = self.fit_logistic_curve(hist_years, hist_share, L=ceiling, tipping_point=tipping_point)
 
-        # Generate forecast shares using logistic curve
-        forecast_share = self.logistic_function(market_years, ceiling, k, t0)
-        forecast_share = clamp_array(forecast_share, 0, 1)
+        # Generate forecast shares on the full market grid in one pass, then
+        # convert to absolute demand in place (the share buffer becomes ev_demand)
+        forecast_share = expit(k * (market_years - t0))
+        forecast_share *= ceiling
+        np.clip(forecast_share, 0.0, 1.0, out=forecast_share)
 
-        # Convert to absolute demand
-        ev_demand = forecast_share * market_demand
-        ev_demand = clamp_array(ev_demand, 0, market_demand)
+        ev_demand = forecast_share
+        ev_demand *= market_demand
+        np.clip(ev_demand, 0.0, market_demand, out=ev_demand)
 
         return ev_demand
 
@@ -255,6 +265,20 @@ class DemandForecaster:
         hist_years = np.array(historical_years)
         hist_ngv = np.array(historical_ngv)
 
+        # No NGV history at all: skip peak detection and decline modeling
+        if hist_ngv.sum() == 0:
+            metadata = {
+                'model': 'zero',
+                'reason': 'no_historical_data',
+                'peak_info': {
+                    'peak_year': None,
+                    'peak_sales': 0,
+                    'peak_share': 0,
+                    'has_significant_presence': False
+                }
+            }
+            return np.zeros_like(market_demand, dtype=float), metadata
+
         # Get historical market demand for share calculation
         hist_market = np.interp(hist_years, market_years, market_demand)
 
@@ -268,8 +292,9 @@ class DemandForecaster:
             tipping_point=tipping_point
         )
 
-        # Ensure non-negative and within market bounds
-        forecast_ngv = clamp_array(forecast_ngv, 0, market_demand)
+        # Ensure non-negative and within market bounds (in place: the NGV
+        # model already returns a fresh, forecast-sized array)
+        np.clip(forecast_ngv, 0, market_demand, out=forecast_ngv)
 
         return forecast_ngv, metadata
 
@@ -325,6 +350,39 @@ class DemandForecaster:
         return fleet
 
 
+def build_demand_frame(forecast: Dict) -> pd.DataFrame:
+    """
+    Build the columnar (one row per year) view of a demand forecast
+
+    Args:
+        forecast: Forecast dict with 'years', 'market', 'ev', 'ice', 'ngv' and
+            '*_share' arrays, plus an optional 'fleet' dict
+
+    Returns:
+        DataFrame with Year, Market, EV, ICE, NGV, *_Share columns and, when
+        fleet tracking succeeded, EV/ICE/NGV/Total_Fleet columns
+    """
+    columns = {
+        'Year': np.asarray(forecast['years']).astype(int),
+        'Market': forecast['market'],
+        'EV': forecast['ev'],
+        'ICE': forecast['ice'],
+        'NGV': forecast['ngv'],
+        'EV_Share': forecast['ev_share'],
+        'ICE_Share': forecast['ice_share'],
+        'NGV_Share': forecast['ngv_share']
+    }
+
+    fleet = forecast.get('fleet')
+    if fleet and 'error' not in fleet:
+        columns['EV_Fleet'] = fleet['ev']
+        columns['ICE_Fleet'] = fleet['ice']
+        columns['NGV_Fleet'] = fleet['ngv']
+        columns['Total_Fleet'] = fleet['total']
+
+    return pd.DataFrame(columns)
+
+
 def run_demand_forecast_segment(
     data_loader,
     region: str,
@@ -439,6 +497,9 @@ def run_demand_forecast_segment(
         except Exception as e:
             result['fleet'] = {'error': str(e)}
 
+    # Columnar view of the same arrays, used for tabular export
+    result['demand_df'] = build_demand_frame(result)
+
     return result
 
 
@@ -5,19 +5,43 @@ Supports LCV, MCV, HCV segments and three powertrains (EV, ICE, NGV)
 """
 
 import json
+import logging
 import os
 import sys
+import traceback
 import pandas as pd
 import numpy as np
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, Optional, List
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from data_loader import DataLoader
 from cost_analysis import run_cost_analysis
-from demand_forecast import run_demand_forecast_segment
+from demand_forecast import run_demand_forecast_segment, build_demand_frame
+
+
+logger = logging.getLogger(__name__)
+
+# Demand series summed across segments into the Total_CV aggregate
+TOTAL_SERIES = ('market', 'ev', 'ice', 'ngv')
+
+RULE = '-' * 70
+HEAVY_RULE = '=' * 70
+
+# CSV export columns (fleet columns are only written when fleet tracking ran)
+CSV_FIELDS = [
+    'Region', 'Segment', 'Year', 'Market', 'EV', 'ICE', 'NGV',
+    'EV_Share', 'ICE_Share', 'NGV_Share'
+]
+CSV_FLEET_FIELDS = ['EV_Fleet', 'ICE_Fleet', 'NGV_Fleet', 'Total_Fleet']
 
 
 class ForecastOrchestrator:
@@ -30,7 +54,8 @@ class ForecastOrchestrator:
         data_dir: Optional[str] = None,
         track_fleet: bool = False,
         fleet_lifetimes: Optional[Dict[str, float]] = None,
-        ngv_half_life: float = 6.0
+        ngv_half_life: float = 6.0,
+        verbose: bool = True
     ):
         """
         Initialize forecaster
@@ -42,11 +67,24 @@ class ForecastOrchestrator:
             track_fleet: Whether to track fleet evolution
             fleet_lifetimes: Dict of segment-specific lifetimes {"LCV": 12, "MCV": 15, "HCV": 18}
             ngv_half_life: NGV decline half-life in years
+            verbose: Report per-segment and total forecast summaries
         """
         self.end_year = end_year
+        self.verbose = verbose
         self.track_fleet = track_fleet
         self.data_loader = DataLoader(data_dir)
 
+        # Constructor arguments, used to rebuild the orchestrator in worker processes
+        self.config = {
+            'end_year': end_year,
+            'segment_ceilings': segment_ceilings,
+            'data_dir': data_dir,
+            'track_fleet': track_fleet,
+            'fleet_lifetimes': fleet_lifetimes,
+            'ngv_half_life': ngv_half_life,
+            'verbose': verbose
+        }
+
         # Set default segment-specific ceilings
         if segment_ceilings is None:
             segment_ceilings = {
@@ -73,43 +111,49 @@ class ForecastOrchestrator:
             'min_significant_share': 0.01
         }
 
-    def forecast_segment(self, region: str, segment: str) -> Dict[str, any]:
+    def forecast_segment(
+        self,
+        region: str,
+        segment: str,
+        cost_result: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, any]:
         """
         Run complete forecast for a single segment in a region
 
         Args:
             region: Region name (China, USA, Europe, Rest_of_World)
             segment: Segment identifier (LCV, MCV, HCV)
+            cost_result: Pre-computed run_cost_analysis output for the region
+                (if None, cost analysis is run for this segment only)
 
         Returns:
             Dictionary containing all forecasts and analyses for the segment
         """
-        print(f"\n{'-'*70}")
-        print(f"  Segment: {segment}")
-        print(f"{'-'*70}")
+        logger.info("\n%s\n  Segment: %s\n%s", RULE, segment, RULE)
 
         # Step 1: Cost Analysis & Tipping Point Detection
-        print(f"  [1/2] Cost analysis for {segment}...")
-        cost_result = run_cost_analysis(
-            self.data_loader,
-            region,
-            segments=[segment],
-            end_year=self.end_year
-        )
+        logger.info("  [1/2] Cost analysis for %s...", segment)
+        if cost_result is None or segment not in cost_result:
+            cost_result = run_cost_analysis(
+                self.data_loader,
+                region,
+                segments=[segment],
+                end_year=self.end_year
+            )
 
         segment_cost = cost_result[segment]
         tipping_point = segment_cost['tipping_point']
 
         if tipping_point:
-            print(f"    ✓ Tipping point: {tipping_point}")
+            logger.info("    ✓ Tipping point: %s", tipping_point)
         else:
-            print(f"    ⚠ No tipping point found")
+            logger.info("    ⚠ No tipping point found")
 
-        print(f"    ✓ EV CAGR: {segment_cost['ev_cagr']:.2%}")
-        print(f"    ✓ ICE CAGR: {segment_cost['ice_cagr']:.2%}")
+        logger.info("    ✓ EV CAGR: %.2f%%", segment_cost['ev_cagr'] * 100)
+        logger.info("    ✓ ICE CAGR: %.2f%%", segment_cost['ice_cagr'] * 100)
 
         # Step 2: Demand Forecast
-        print(f"  [2/2] Demand forecast for {segment}...")
+        logger.info("  [2/2] Demand forecast for %s...", segment)
         demand_result = run_demand_forecast_segment(
             self.data_loader,
             region,
@@ -124,18 +168,23 @@ class ForecastOrchestrator:
 
         validation = demand_result['validation']
         if validation['is_valid']:
-            print(f"    ✓ Validation passed")
+            if self.verbose:
+                logger.info("    ✓ Validation passed")
         else:
-            print(f"    ⚠ Validation warning: {validation['message']}")
-
-        # Print forecast summary
-        final_idx = -1
-        final_year = int(demand_result['years'][final_idx])
-        print(f"\n    Forecast Summary for {final_year}:")
-        print(f"      Market:  {demand_result['market'][final_idx]:>12,.0f} units")
-        print(f"      EV:      {demand_result['ev'][final_idx]:>12,.0f} units ({demand_result['ev_share'][final_idx]:>5.1%})")
-        print(f"      ICE:     {demand_result['ice'][final_idx]:>12,.0f} units ({demand_result['ice_share'][final_idx]:>5.1%})")
-        print(f"      NGV:     {demand_result['ngv'][final_idx]:>12,.0f} units ({demand_result['ngv_share'][final_idx]:>5.1%})")
+            logger.warning("    ⚠ Validation warning: %s", validation['message'])
+
+        # Print forecast summary (thousands separators need str.format, so only
+        # build the lines when INFO output is enabled)
+        if self.verbose and logger.isEnabledFor(logging.INFO):
+            final_idx = -1
+            final_year = int(demand_result['years'][final_idx])
+            logger.info(
+                f"\n    Forecast Summary for {final_year}:\n"
+                f"      Market:  {demand_result['market'][final_idx]:>12,.0f} units\n"
+                f"      EV:      {demand_result['ev'][final_idx]:>12,.0f} units ({demand_result['ev_share'][final_idx]:>5.1%})\n"
+                f"      ICE:     {demand_result['ice'][final_idx]:>12,.0f} units ({demand_result['ice_share'][final_idx]:>5.1%})\n"
+                f"      NGV:     {demand_result['ngv'][final_idx]:>12,.0f} units ({demand_result['ngv_share'][final_idx]:>5.1%})"
+            )
 
         # Combine results
         result = {
@@ -146,13 +195,21 @@ class ForecastOrchestrator:
 
         return result
 
-    def forecast_region(self, region: str, segments: Optional[List[str]] = None) -> Dict[str, any]:
+    def forecast_region(
+        self,
+        region: str,
+        segments: Optional[List[str]] = None,
+        parallel: bool = False
+    ) -> Dict[str, any]:
         """
         Run complete forecast for a region (all segments or specified segments)
 
         Args:
             region: Region name
             segments: List of segments to forecast (None = all segments)
+            parallel: Forecast segments concurrently in worker processes
+                (only when more than one CPU is available; callers on spawn
+                platforms then need an ``if __name__ == '__main__'`` guard)
 
         Returns:
             Dictionary containing segment-level and aggregated forecasts
@@ -160,57 +217,97 @@ class ForecastOrchestrator:
         if segments is None:
             segments = ["LCV", "MCV", "HCV"]
 
-        print(f"\n{'='*70}")
-        print(f"Commercial Vehicle Demand Forecast for Region: {region}")
-        print(f"{'='*70}")
+        logger.info("\n%s\nCommercial Vehicle Demand Forecast for Region: %s\n%s",
+                    HEAVY_RULE, region, HEAVY_RULE)
 
         segment_results = {}
 
-        # Forecast each segment
-        for segment in segments:
-            try:
-                segment_results[segment] = self.forecast_segment(region, segment)
-            except Exception as e:
-                print(f"\n✗ Error forecasting {segment}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+        # Cost analysis for all segments in one pass (shared across segments)
+        cost_result = run_cost_analysis(
+            self.data_loader,
+            region,
+            segments=segments,
+            end_year=self.end_year
+        )
+
+        # Forecast each segment (segments are independent once costs are known)
+        max_workers = min(len(segments), os.cpu_count() or 1) if parallel else 1
+        if max_workers > 1:
+            completed = {}
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_run_segment, self.config, region, segment, cost_result): segment
+                    for segment in segments
+                }
+                for future in as_completed(futures):
+                    segment = futures[future]
+                    try:
+                        completed[segment] = future.result()
+                    except Exception as e:
+                        logger.error("\n✗ Error forecasting %s: %s", segment, e)
+                        traceback.print_exc()
+
+            # Keep the requested segment order
+            for segment in segments:
+                if segment in completed:
+                    segment_results[segment] = completed[segment]
+        else:
+            for segment in segments:
+                try:
+                    segment_results[segment] = self.forecast_segment(region, segment, cost_result)
+                except Exception as e:
+                    logger.error("\n✗ Error forecasting %s: %s", segment, e)
+                    traceback.print_exc()
+                    continue
 
         # Aggregate segments to total CV
-        print(f"\n{'-'*70}")
-        print(f"  Aggregating Segments to Total Commercial Vehicles")
-        print(f"{'-'*70}")
+        logger.info("\n%s\n  Aggregating Segments to Total Commercial Vehicles\n%s", RULE, RULE)
 
         if not segment_results:
-            print("  ✗ No segment results to aggregate")
+            logger.error("  ✗ No segment results to aggregate")
             return {'region': region, 'segment_results': {}, 'total_cv': None}
 
         # Get years from first segment
         first_segment = list(segment_results.values())[0]
         years = first_segment['demand_forecast']['years']
 
-        # Initialize aggregated arrays
-        total_market = np.zeros_like(years, dtype=float)
-        total_ev = np.zeros_like(years, dtype=float)
-        total_ice = np.zeros_like(years, dtype=float)
-        total_ngv = np.zeros_like(years, dtype=float)
+        demands = [result['demand_forecast'] for result in segment_results.values()]
+        same_grid = all(
+            demand['years'] is years
+            or (len(demand['years']) == len(years) and np.array_equal(demand['years'], years))
+            for demand in demands
+        )
+
+        # One (series x years) buffer holds all four totals; the per-series
+        # arrays below are row views into it
+        totals = np.zeros((len(TOTAL_SERIES), len(years)), dtype=float)
 
         # Sum across segments
-        for segment, result in segment_results.items():
-            demand = result['demand_forecast']
-            seg_years = demand['years']
-            # Interpolate to common years if needed
-            total_market += np.interp(years, seg_years, demand['market'])
-            total_ev += np.interp(years, seg_years, demand['ev'])
-            total_ice += np.interp(years, seg_years, demand['ice'])
-            total_ngv += np.interp(years, seg_years, demand['ngv'])
-
-        final_year = int(years[-1])
-        print(f"\n  Total CV Forecast for {final_year}:")
-        print(f"    Market:  {total_market[-1]:>15,.0f} units")
-        print(f"    EV:      {total_ev[-1]:>15,.0f} units ({total_ev[-1]/total_market[-1]:>5.1%})")
-        print(f"    ICE:     {total_ice[-1]:>15,.0f} units ({total_ice[-1]/total_market[-1]:>5.1%})")
-        print(f"    NGV:     {total_ngv[-1]:>15,.0f} units ({total_ngv[-1]/total_market[-1]:>5.1%})")
+        if same_grid:
+            # All segments share the annual grid: plain column-wise sums
+            stacked = np.stack([[d[key] for key in TOTAL_SERIES] for d in demands])
+            np.add.reduce(stacked, axis=0, out=totals)
+        else:
+            # Align by calendar year (not interpolation): years a segment does
+            # not cover contribute 0 instead of a linear extrapolation
+            year_index = np.asarray(years).astype(int)
+            for demand in demands:
+                seg_index = np.asarray(demand['years']).astype(int)
+                for row, key in enumerate(TOTAL_SERIES):
+                    series = pd.Series(demand[key], index=seg_index)
+                    totals[row] += series.reindex(year_index, fill_value=0.0).to_numpy()
+
+        total_market, total_ev, total_ice, total_ngv = totals
+
+        if self.verbose and logger.isEnabledFor(logging.INFO):
+            final_year = int(years[-1])
+            logger.info(
+                f"\n  Total CV Forecast for {final_year}:\n"
+                f"    Market:  {total_market[-1]:>15,.0f} units\n"
+                f"    EV:      {total_ev[-1]:>15,.0f} units ({total_ev[-1]/total_market[-1]:>5.1%})\n"
+                f"    ICE:     {total_ice[-1]:>15,.0f} units ({total_ice[-1]/total_market[-1]:>5.1%})\n"
+                f"    NGV:     {total_ngv[-1]:>15,.0f} units ({total_ngv[-1]/total_market[-1]:>5.1%})"
+            )
 
         # Create total CV result
         total_cv_result = {
@@ -224,6 +321,7 @@ class ForecastOrchestrator:
             'ice_share': total_ice / np.maximum(total_market, 1),
             'ngv_share': total_ngv / np.maximum(total_market, 1)
         }
+        total_cv_result['demand_df'] = build_demand_frame(total_cv_result)
 
         return {
             'region': region,
@@ -239,60 +337,25 @@ class ForecastOrchestrator:
             result: Forecast result dictionary
             output_path: Path to output CSV file
         """
-        rows = []
-
         region = result['region']
         total_cv = result.get('total_cv')
 
-        # Export segment-level data
-        for segment, seg_result in result.get('segment_results', {}).items():
-            demand = seg_result['demand_forecast']
-            years = demand['years']
-
-            for i, year in enumerate(years):
-                row = {
-                    'Region': region,
-                    'Segment': segment,
-                    'Year': int(year),
-                    'Market': demand['market'][i],
-                    'EV': demand['ev'][i],
-                    'ICE': demand['ice'][i],
-                    'NGV': demand['ngv'][i],
-                    'EV_Share': demand['ev_share'][i],
-                    'ICE_Share': demand['ice_share'][i],
-                    'NGV_Share': demand['ngv_share'][i]
-                }
-
-                # Add fleet data if available
-                if 'fleet' in demand and 'error' not in demand['fleet']:
-                    fleet = demand['fleet']
-                    row['EV_Fleet'] = fleet['ev'][i]
-                    row['ICE_Fleet'] = fleet['ice'][i]
-                    row['NGV_Fleet'] = fleet['ngv'][i]
-                    row['Total_Fleet'] = fleet['total'][i]
-
-                rows.append(row)
-
-        # Export total CV aggregated data
+        # Segment and total frames are already columnar: just label and stack them
+        frames = [
+            seg_result['demand_forecast']['demand_df'].assign(Region=region, Segment=segment)
+            for segment, seg_result in result.get('segment_results', {}).items()
+        ]
         if total_cv:
-            years = total_cv['years']
-            for i, year in enumerate(years):
-                row = {
-                    'Region': region,
-                    'Segment': 'Total_CV',
-                    'Year': int(year),
-                    'Market': total_cv['market'][i],
-                    'EV': total_cv['ev'][i],
-                    'ICE': total_cv['ice'][i],
-                    'NGV': total_cv['ngv'][i],
-                    'EV_Share': total_cv['ev_share'][i],
-                    'ICE_Share': total_cv['ice_share'][i],
-                    'NGV_Share': total_cv['ngv_share'][i]
-                }
-                rows.append(row)
+            frames.append(total_cv['demand_df'].assign(Region=region, Segment='Total_CV'))
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=CSV_FIELDS)
 
-        df = pd.DataFrame(rows)
-        df.to_csv(output_path, index=False)
+        has_fleet = CSV_FLEET_FIELDS[0] in df.columns
+        fieldnames = CSV_FIELDS + CSV_FLEET_FIELDS if has_fleet else CSV_FIELDS
+        df[fieldnames].to_csv(output_path, index=False)
         print(f"\n✓ Results exported to: {output_path}")
 
     def export_to_json(self, result: Dict, output_path: str):
@@ -303,27 +366,64 @@ class ForecastOrchestrator:
             result: Forecast result dictionary
             output_path: Path to output JSON file
         """
-        # Convert numpy arrays to lists for JSON serialization
-        def convert_numpy(obj):
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, dict):
-                return {k: convert_numpy(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy(item) for item in obj]
-            elif isinstance(obj, (np.integer, np.floating)):
-                return float(obj)
-            else:
-                return obj
-
-        result_json = convert_numpy(result)
+        # The demand_df frames duplicate the arrays already in the result
+        result = _drop_frames(result)
+
+        if orjson is not None:
+            # orjson serializes numpy arrays natively, no conversion pass needed
+            try:
+                payload = orjson.dumps(
+                    result,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+                )
+            except TypeError:
+                payload = None  # e.g. non-contiguous arrays; use stdlib path
+
+            if payload is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(payload)
+                print(f"\n✓ Results exported to: {output_path}")
+                return
 
         with open(output_path, 'w') as f:
-            json.dump(result_json, f, indent=2)
+            json.dump(result, f, indent=2, default=_json_default)
 
         print(f"\n✓ Results exported to: {output_path}")
 
 
+def _json_default(obj):
+    """json.dump fallback for the numpy types found in forecast results"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (np.integer, np.floating, np.bool_)):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _drop_frames(obj):
+    """Copy of a nested result dict without its DataFrame values"""
+    if isinstance(obj, dict):
+        return {k: _drop_frames(v) for k, v in obj.items() if not isinstance(v, pd.DataFrame)}
+    return obj
+
+
+def _run_segment(config: Dict, region: str, segment: str, cost_result: Dict) -> Dict[str, any]:
+    """
+    Worker entry point: rebuild an orchestrator from its config and forecast one segment
+
+    Args:
+        config: ForecastOrchestrator constructor arguments
+        region: Region name
+        segment: Segment identifier (LCV, MCV, HCV)
+        cost_result: Pre-computed run_cost_analysis output for the region
+
+    Returns:
+        Segment forecast result (see ForecastOrchestrator.forecast_segment)
+    """
+    orchestrator = ForecastOrchestrator(**config)
+    return orchestrator.forecast_segment(region, segment, cost_result)
+
+
 def main():
     """Main entry point for command-line usage"""
     parser = argparse.ArgumentParser(
@@ -385,8 +485,27 @@ def main():
         help="NGV decline half-life in years (default: 6.0)"
     )
 
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Forecast segments concurrently in worker processes (default: one at a time)"
+    )
+
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only report warnings and errors while forecasting"
+    )
+
     args = parser.parse_args()
 
+    # Progress output goes through this module's logger (plain messages on stdout)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING if args.quiet else logging.INFO)
+    logger.propagate = False
+
     # Determine output directory
     if args.output_dir is None:
         scripts_dir = os.path.dirname(os.path.abspath(__file__))
@@ -409,11 +528,12 @@ def main():
     orchestrator = ForecastOrchestrator(
         end_year=args.end_year,
         track_fleet=args.track_fleet,
-        ngv_half_life=args.ngv_half_life
+        ngv_half_life=args.ngv_half_life,
+        verbose=not args.quiet
     )
 
     # Run forecast
-    result = orchestrator.forecast_region(args.region, segments=segments)
+    result = orchestrator.forecast_region(args.region, segments=segments, parallel=args.parallel)
 
     # Export results
     base_filename = f"commercial_vehicle_{args.region}_{args.end_year}"
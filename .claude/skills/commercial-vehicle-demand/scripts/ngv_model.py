@@ -5,6 +5,7 @@ Models NGV as a transitional "chimera" technology that peaks and then declines
 as EV adoption accelerates. Uses exponential decay with configurable half-life.
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
@@ -12,6 +13,49 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _safe_share(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    numerator / denominator, with 0 wherever the denominator is not positive.
+
+    Non-positive denominators are swapped for +inf, so the result is exactly 0
+    there from a single divide (no masked out= buffer needed).
+    """
+    denominator = np.asarray(denominator, dtype=float)
+    return numerator / np.where(denominator > 0, denominator, np.inf)
+
+
+def _rolling_mean_argmax(shares: np.ndarray, window: int) -> Tuple[int, float]:
+    """
+    Moving average of shares (cumulative-sum form) and the index of its maximum.
+
+    Returns:
+        Tuple of (peak_idx, smoothed_peak_value)
+    """
+    c = np.cumsum(shares)
+    sums = c[window-1:].copy()
+    sums[1:] -= c[:-window]
+    smoothed = sums / window
+    peak_idx = np.argmax(smoothed)
+    return peak_idx, smoothed[peak_idx]
+
+
+def _ngv_decline_shares(forecast_years: np.ndarray,
+                        decline_start_year: float,
+                        peak_share: float,
+                        decay_rate: float,
+                        target_2035: float) -> np.ndarray:
+    """
+    NGV share per forecast year: peak share until decline starts, then
+    exponential decay, capped at the 2035 target once decline has started.
+    """
+    # Before decline: years_since_decline clipped to 0 keeps the peak share
+    years_since_decline = np.maximum(forecast_years - decline_start_year, 0.0)
+    shares = peak_share * np.exp(-decay_rate * years_since_decline)
+
+    capped = (forecast_years >= 2035) & (forecast_years > decline_start_year)
+    return np.where(capped, np.minimum(shares, target_2035), shares)
+
+
 class NGVModel:
     """
     Models NGV demand as a declining chimera technology.
@@ -40,6 +84,16 @@ class NGVModel:
         logger.info(f"NGV Model initialized: half_life={self.half_life_years}yr, "
                    f"target_2035={self.target_share_2035}")
 
+    @property
+    def half_life_years(self) -> float:
+        """NGV share half-life in years (updates the cached decay rate when set)"""
+        return self._half_life_years
+
+    @half_life_years.setter
+    def half_life_years(self, value: float):
+        self._half_life_years = value
+        self._decay_lambda = math.log(2.0) / value
+
     def detect_peak(self,
                     historical_years: np.ndarray,
                     historical_ngv: np.ndarray,
@@ -67,10 +121,10 @@ class NGVModel:
                 'has_significant_presence': False
             }
 
+        historical_ngv = np.asarray(historical_ngv, dtype=float)
+
         # Calculate shares
-        shares = np.divide(historical_ngv, historical_market,
-                          where=historical_market > 0,
-                          out=np.zeros_like(historical_ngv, dtype=float))
+        shares = _safe_share(historical_ngv, historical_market)
 
         # Check if NGV has significant presence
         max_share = np.max(shares) if len(shares) > 0 else 0
@@ -88,13 +142,11 @@ class NGVModel:
         # Find peak year (use rolling average to smooth noise)
         if len(shares) >= self.peak_detection_window:
             window = self.peak_detection_window
-            smoothed_shares = np.convolve(shares,
-                                          np.ones(window)/window,
-                                          mode='valid')
-            # Adjust years to match smoothed array
-            smooth_years = historical_years[window//2:len(smoothed_shares)+window//2]
-            peak_idx = np.argmax(smoothed_shares)
-            peak_year = smooth_years[peak_idx]
+            peak_idx, _ = _rolling_mean_argmax(shares, window)
+            # Smoothed value k averages years k..k+window-1: report its centre year
+            offset = (window - 1) // 2
+            assert offset + peak_idx < len(historical_years)
+            peak_year = historical_years[offset + peak_idx]
         else:
             peak_idx = np.argmax(shares)
             peak_year = historical_years[peak_idx]
@@ -112,6 +164,27 @@ class NGVModel:
             'has_significant_presence': True
         }
 
+    def get_decline_start_year(self,
+                               peak_year: int,
+                               tipping_point: Optional[float] = None) -> float:
+        """
+        Year after which NGV share starts to decay, per decline_start_mode.
+
+        Args:
+            peak_year: Detected NGV peak year
+            tipping_point: EV cost parity year (optional)
+
+        Returns:
+            Decline start year
+        """
+        if self.decline_start_mode == 'max_peak_or_tipping':
+            if tipping_point is not None:
+                return max(peak_year, tipping_point)
+            return peak_year
+        elif self.decline_start_mode == 'tipping_only':
+            return tipping_point if tipping_point else peak_year
+        return peak_year
+
     def forecast_ngv(self,
                      historical_years: np.ndarray,
                      historical_ngv: np.ndarray,
@@ -154,62 +227,30 @@ class NGVModel:
 
         # Determine decline start year
         peak_year = peak_info['peak_year']
-
-        if self.decline_start_mode == 'max_peak_or_tipping':
-            if tipping_point is not None:
-                decline_start_year = max(peak_year, tipping_point)
-            else:
-                decline_start_year = peak_year
-        elif self.decline_start_mode == 'tipping_only':
-            decline_start_year = tipping_point if tipping_point else peak_year
-        else:
-            decline_start_year = peak_year
+        decline_start_year = self.get_decline_start_year(peak_year, tipping_point)
 
         logger.info(f"NGV decline starts: {decline_start_year} "
                    f"(peak: {peak_year}, tipping: {tipping_point})")
 
-        # Build complete time series
-        all_years = np.concatenate([historical_years, forecast_years])
-        all_market = np.concatenate([historical_market, forecast_market])
-
-        # Initialize NGV sales array
-        ngv_sales = np.zeros_like(all_years, dtype=float)
-
-        # Fill historical values
-        hist_len = len(historical_years)
-        ngv_sales[:hist_len] = historical_ngv
-
         # Forecast NGV for future years
         peak_share = peak_info['peak_share']
 
-        for i in range(hist_len, len(all_years)):
-            year = all_years[i]
-            market = all_market[i]
-
-            if year <= decline_start_year:
-                # Before decline: maintain peak share
-                share = peak_share
-            else:
-                # After decline start: exponential decay
-                years_since_decline = year - decline_start_year
-                decay_factor = np.exp(-np.log(2) * years_since_decline / self.half_life_years)
-                share = peak_share * decay_factor
-
-                # Apply 2035 target constraint
-                if year >= 2035:
-                    share = min(share, self.target_share_2035)
-
-            ngv_sales[i] = share * market
+        # Peak share until decline starts, then exponential decay with 2035 cap
+        shares = _ngv_decline_shares(np.asarray(forecast_years, dtype=float),
+                                     float(decline_start_year),
+                                     float(peak_share),
+                                     self._decay_lambda,
+                                     float(self.target_share_2035))
 
-        # Extract forecast portion
-        forecast_ngv = ngv_sales[hist_len:]
+        forecast_ngv = shares * forecast_market
 
         metadata = {
             'model': 'exponential_decline',
             'peak_info': peak_info,
             'decline_start_year': int(decline_start_year),
             'half_life_years': self.half_life_years,
-            'final_share_end': float(ngv_sales[-1] / all_market[-1]) if all_market[-1] > 0 else 0
+            'final_share_end': (float(forecast_ngv[-1] / forecast_market[-1])
+                                if len(forecast_market) > 0 and forecast_market[-1] > 0 else 0.0)
         }
 
         logger.info(f"NGV forecast complete: final year share = "
@@ -239,9 +280,7 @@ class NGVModel:
             issues.append("negative_values")
 
         # Check shares are within bounds
-        shares = np.divide(forecast_ngv, forecast_market,
-                          where=forecast_market > 0,
-                          out=np.zeros_like(forecast_ngv, dtype=float))
+        shares = _safe_share(forecast_ngv, forecast_market)
 
         if np.any(shares > 1.0):
             issues.append("share_exceeds_100%")
@@ -256,11 +295,13 @@ class NGVModel:
                 issues.append("increasing_trend_detected")
 
         # Check 2035 target
-        if 2035 in forecast_years:
-            idx_2035 = np.where(forecast_years == 2035)[0][0]
-            share_2035 = shares[idx_2035]
-            if share_2035 > self.target_share_2035 + 0.01:  # Allow 1% tolerance
-                issues.append(f"2035_share_exceeds_target: {share_2035:.2%}")
+        # (forecast_years is sorted: bounds test + binary search instead of scans)
+        if len(forecast_years) > 0 and forecast_years[0] <= 2035 <= forecast_years[-1]:
+            idx_2035 = int(np.searchsorted(forecast_years, 2035))
+            if forecast_years[idx_2035] == 2035:
+                share_2035 = shares[idx_2035]
+                if share_2035 > self.target_share_2035 + 0.01:  # Allow 1% tolerance
+                    issues.append(f"2035_share_exceeds_target: {share_2035:.2%}")
 
         return {
             'valid': len(issues) == 0,
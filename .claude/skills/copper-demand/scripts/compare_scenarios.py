@@ -9,6 +9,31 @@ import pandas as pd
 from pathlib import Path
 
 
+def _read_csv(filepath):
+    """Read a forecast CSV, using the multithreaded pyarrow parser when available"""
+    try:
+        return pd.read_csv(filepath, engine='pyarrow')
+    except (ImportError, ValueError):
+        # pyarrow not installed (or too old for this pandas)
+        return pd.read_csv(filepath)
+
+
+def _enrich(data):
+    """Add the derived share columns used in the comparison, one vectorized pass per column"""
+    data = data.assign(auto_share=data['auto_total'] / data['total_demand'])
+
+    if 'auto_bev' in data:
+        data = data.assign(ev_share=data['auto_bev'] / data['total_demand'])
+
+    if 'grid_gen_wind' in data and 'grid_gen_solar' in data:
+        data = data.assign(
+            green=data['auto_bev'] + data['grid_gen_wind'] + data['grid_gen_solar'],
+            green_share=lambda d: d['green'] / d['total_demand']
+        )
+
+    return data
+
+
 def compare_scenarios(filepaths, output_format='table'):
     """
     Compare multiple scenario outputs
@@ -31,14 +56,17 @@ def compare_scenarios(filepaths, output_format='table'):
 
         try:
             if filepath.endswith('.csv'):
-                data = pd.read_csv(filepath)
+                data = _read_csv(filepath)
             elif filepath.endswith('.json'):
                 data = pd.read_json(filepath)
+            elif filepath.endswith('.parquet'):
+                data = pd.read_parquet(filepath)
             else:
                 print(f"Skipping {filepath}: unsupported format")
                 continue
 
-            scenarios[scenario_name] = data
+            # Index by year once so per-year lookups below are hash lookups
+            scenarios[scenario_name] = _enrich(data.set_index('year').sort_index())
         except Exception as e:
             print(f"Error loading {filepath}: {e}")
             continue
@@ -51,7 +79,7 @@ def compare_scenarios(filepaths, output_format='table'):
     # Get all unique years across scenarios
     all_years = set()
     for data in scenarios.values():
-        all_years.update(data['year'].tolist())
+        all_years.update(data.index.tolist())
 
     # Select key milestone years for comparison (every 5 years, up to max available)
     max_year = max(all_years)
@@ -69,23 +97,22 @@ def compare_scenarios(filepaths, output_format='table'):
         year_data = {'year': year}
 
         for scenario_name, data in scenarios.items():
-            year_row = data[data['year'] == year]
-            if len(year_row) == 0:
+            try:
+                row = data.loc[year]
+            except KeyError:
                 continue
 
-            row = year_row.iloc[0]
             year_data[f'{scenario_name}_total'] = row['total_demand']
             year_data[f'{scenario_name}_auto'] = row['auto_total']
-            year_data[f'{scenario_name}_auto_share'] = row['auto_total'] / row['total_demand']
+            year_data[f'{scenario_name}_auto_share'] = row['auto_share']
 
-            if 'auto_bev' in row:
+            if 'ev_share' in row:
                 year_data[f'{scenario_name}_ev'] = row['auto_bev']
-                year_data[f'{scenario_name}_ev_share'] = row['auto_bev'] / row['total_demand']
+                year_data[f'{scenario_name}_ev_share'] = row['ev_share']
 
-            if 'grid_gen_wind' in row and 'grid_gen_solar' in row:
-                green_copper = row['auto_bev'] + row['grid_gen_wind'] + row['grid_gen_solar']
-                year_data[f'{scenario_name}_green'] = green_copper
-                year_data[f'{scenario_name}_green_share'] = green_copper / row['total_demand']
+            if 'green_share' in row:
+                year_data[f'{scenario_name}_green'] = row['green']
+                year_data[f'{scenario_name}_green_share'] = row['green_share']
 
         comparison.append(year_data)
 
@@ -103,47 +130,42 @@ def print_table_comparison(scenarios, comparison):
     scenario_names = list(scenarios.keys())
     baseline_name = scenario_names[0]  # Use first as baseline for % comparisons
 
-    print("\n" + "=" * 80)
-    print("SCENARIO COMPARISON REPORT")
-    print("=" * 80)
+    # Build the whole report and write it to stdout once
+    lines = []
+
+    lines.append("\n" + "=" * 80)
+    lines.append("SCENARIO COMPARISON REPORT")
+    lines.append("=" * 80)
 
     # Summary table
-    print("\nTotal Copper Demand (Million Tonnes)")
-    print("-" * 80)
-    print(f"{'Year':<8}", end='')
-    for name in scenario_names:
-        print(f"{name:<15}", end='')
-    print()
+    lines.append("\nTotal Copper Demand (Million Tonnes)")
+    lines.append("-" * 80)
+    lines.append(f"{'Year':<8}" + ''.join(f"{name:<15}" for name in scenario_names))
 
     for row in comparison:
-        year = row['year']
-        print(f"{year:<8}", end='')
+        parts = [f"{row['year']:<8}"]
         for name in scenario_names:
             total_key = f'{name}_total'
             if total_key in row:
                 value = row[total_key] / 1_000_000  # Convert to Mt
-                print(f"{value:>14.1f}", end='')
+                parts.append(f"{value:>14.1f}")
             else:
-                print(f"{'N/A':>14}", end='')
-        print()
+                parts.append(f"{'N/A':>14}")
+        lines.append(''.join(parts))
 
     # Difference from baseline
-    print(f"\nDifference from {baseline_name} (%)")
-    print("-" * 80)
-    print(f"{'Year':<8}", end='')
-    for name in scenario_names:
-        if name != baseline_name:
-            print(f"{name:<15}", end='')
-    print()
+    lines.append(f"\nDifference from {baseline_name} (%)")
+    lines.append("-" * 80)
+    lines.append(f"{'Year':<8}" + ''.join(f"{name:<15}" for name in scenario_names
+                                          if name != baseline_name))
 
     for row in comparison:
-        year = row['year']
         baseline_key = f'{baseline_name}_total'
         if baseline_key not in row:
             continue
 
         baseline_value = row[baseline_key]
-        print(f"{year:<8}", end='')
+        parts = [f"{row['year']:<8}"]
 
         for name in scenario_names:
             if name == baseline_name:
@@ -151,52 +173,46 @@ def print_table_comparison(scenarios, comparison):
             total_key = f'{name}_total'
             if total_key in row:
                 diff = (row[total_key] - baseline_value) / baseline_value * 100
-                print(f"{diff:>+14.1f}", end='')
+                parts.append(f"{diff:>+14.1f}")
             else:
-                print(f"{'N/A':>14}", end='')
-        print()
+                parts.append(f"{'N/A':>14}")
+        lines.append(''.join(parts))
 
     # Green copper comparison
-    print("\nGreen Copper (EV + Solar + Wind) Share of Total (%)")
-    print("-" * 80)
-    print(f"{'Year':<8}", end='')
-    for name in scenario_names:
-        print(f"{name:<15}", end='')
-    print()
+    lines.append("\nGreen Copper (EV + Solar + Wind) Share of Total (%)")
+    lines.append("-" * 80)
+    lines.append(f"{'Year':<8}" + ''.join(f"{name:<15}" for name in scenario_names))
 
     for row in comparison:
-        year = row['year']
-        print(f"{year:<8}", end='')
+        parts = [f"{row['year']:<8}"]
         for name in scenario_names:
             share_key = f'{name}_green_share'
             if share_key in row:
                 value = row[share_key] * 100
-                print(f"{value:>14.1f}", end='')
+                parts.append(f"{value:>14.1f}")
             else:
-                print(f"{'N/A':>14}", end='')
-        print()
+                parts.append(f"{'N/A':>14}")
+        lines.append(''.join(parts))
 
     # Automotive share comparison
-    print("\nAutomotive Share of Total (%)")
-    print("-" * 80)
-    print(f"{'Year':<8}", end='')
-    for name in scenario_names:
-        print(f"{name:<15}", end='')
-    print()
+    lines.append("\nAutomotive Share of Total (%)")
+    lines.append("-" * 80)
+    lines.append(f"{'Year':<8}" + ''.join(f"{name:<15}" for name in scenario_names))
 
     for row in comparison:
-        year = row['year']
-        print(f"{year:<8}", end='')
+        parts = [f"{row['year']:<8}"]
         for name in scenario_names:
             share_key = f'{name}_auto_share'
             if share_key in row:
                 value = row[share_key] * 100
-                print(f"{value:>14.1f}", end='')
+                parts.append(f"{value:>14.1f}")
             else:
-                print(f"{'N/A':>14}", end='')
-        print()
+                parts.append(f"{'N/A':>14}")
+        lines.append(''.join(parts))
+
+    lines.append("\n" + "=" * 80)
 
-    print("\n" + "=" * 80)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
@@ -3,20 +3,91 @@ Data Loader for Copper Demand Forecasting
 Loads real data from curves_catalog_files and processes for forecasting
 """
 
+import hashlib
 import json
+import mmap
+import os
+import pickle
+import numpy as np
 import pandas as pd
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+# Input files read by load_all_data, relative to base_data_path
+DATA_FILES = (
+    'Copper.json', 'Passenger_Cars.json', 'Commercial_Vehicle.json',
+    'Two_Wheeler.json', 'Three_Wheeler.json', 'Energy_Generation.json'
+)
+
+
+def _series_from_points(points):
+    """
+    Build a year-indexed Series from [{'year': ..., 'value': ...}, ...]
+
+    Fills preallocated arrays straight from the points (no intermediate
+    lists); missing values (None) become NaN.
+    """
+    n = len(points)
+    years = np.fromiter((point['year'] for point in points), dtype=np.int64, count=n)
+    values = np.fromiter((point['value'] for point in points), dtype=float, count=n)
+    return pd.Series(values, index=years, copy=False)
+
+
+def _to_series(series):
+    """
+    Year-indexed Series for one regional series entry, in either layout:
+    columnar {'years': [...], 'values': [...]} (see convert_to_columnar)
+    or the original list of {'year', 'value'} points
+    """
+    if 'years' in series:
+        years = np.asarray(series['years'], dtype=np.int64)
+        values = np.asarray(series['values'], dtype=float)
+        return pd.Series(values, index=years, copy=False)
+    return _series_from_points(series['values'])
+
+
+class LazyData(Mapping):
+    """
+    Read-only mapping whose values are computed on first access
+
+    Takes key -> zero-argument callable; each callable runs at most once and
+    its result is kept. Keys that are never read are never loaded.
+    """
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._values = {}
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._loaders[key]()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
 
 class CopperDataLoader:
     """Loads and processes copper demand data from multiple sources"""
 
-    def __init__(self, base_data_path=None):
+    def __init__(self, base_data_path=None, cache_dir=None):
         """
         Initialize data loader
 
         Args:
             base_data_path: Path to data directory (defaults to skill's local data/ folder)
+            cache_dir: Optional directory for a pickled copy of load_all_data's
+                result, reused while the input files are unchanged
         """
         if base_data_path is None:
             # Default to skill's local data directory
@@ -25,15 +96,100 @@ class CopperDataLoader:
         else:
             self.base_data_path = Path(base_data_path)
 
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.regions = ['China', 'USA', 'Europe', 'Rest_of_World', 'Global']
+        self._json_cache = {}  # path -> parsed JSON, shared by the load_* methods
+        self._lazy_data = None  # load_all_data(lazy=True) result, reused by later calls
+
+    def data_files(self):
+        """Input files read by load_all_data"""
+        return [self.base_data_path / filename for filename in DATA_FILES]
+
+    def input_mtimes(self):
+        """mtime_ns of each input file (None if missing), to detect edited data"""
+        mtimes = []
+        for path in self.data_files():
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _load_json(self, path):
+        """
+        Parse a JSON file once per loader instance
+
+        Copper.json feeds both load_copper_consumption and load_segment_shares,
+        so load_all_data would otherwise parse it twice. Cached dicts are
+        treated as read-only by the loaders.
+        """
+        if path not in self._json_cache:
+            if orjson is not None:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                with open(path, 'rb') as f:
+                    try:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except ValueError:  # empty files cannot be mapped
+                        self._json_cache[path] = orjson.loads(f.read())
+                    else:
+                        # Parse straight from the page cache, no read() copy
+                        with mapped, memoryview(mapped) as view:
+                            self._json_cache[path] = orjson.loads(view)
+            else:
+                with open(path, 'r') as f:
+                    self._json_cache[path] = json.load(f)
+        return self._json_cache[path]
+
+    @staticmethod
+    def convert_to_columnar(src_path, dst_path):
+        """
+        One-time migration of a data file to the columnar series layout
+
+        Rewrites every series' values from [{'year': y, 'value': v}, ...] to
+        parallel 'years' / 'values' lists, which the loaders read with a single
+        array conversion instead of two dict lookups per point. Files already
+        in columnar layout are written back unchanged.
+
+        Args:
+            src_path: JSON file in the original layout
+            dst_path: Output path (may equal src_path)
+        """
+        with open(src_path, 'r') as f:
+            data = json.load(f)
+
+        for metric in data.get('metrics', []):
+            for series in metric['data']:
+                if 'years' in series:
+                    continue
+                points = series['values']
+                series['years'] = [point['year'] for point in points]
+                series['values'] = [point['value'] for point in points]
+
+        with open(dst_path, 'w') as f:
+            json.dump(data, f)
+
+    def _prefetch_json(self, paths):
+        """
+        Read and parse several files concurrently into the JSON cache
+
+        Each path is handled by exactly one task. Errors are swallowed here
+        and left for the load_* methods to raise with their usual messages.
+        """
+        def prefetch(path):
+            try:
+                self._load_json(path)
+            except (OSError, ValueError):
+                pass
+
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            list(executor.map(prefetch, paths))
 
     def load_copper_consumption(self):
         """Load historical copper consumption data"""
         copper_file = self.base_data_path / 'Copper.json'
 
         try:
-            with open(copper_file, 'r') as f:
-                data = json.load(f)
+            data = self._load_json(copper_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"Copper data file not found: {copper_file}")
         except json.JSONDecodeError as e:
@@ -45,10 +201,7 @@ class CopperDataLoader:
             if metric['name'] == 'Annual_Consumption':
                 for series in metric['data']:
                     region = series['region']
-                    # Convert to pandas Series
-                    years = [point['year'] for point in series['values']]
-                    values = [point['value'] for point in series['values']]
-                    consumption_data[region] = pd.Series(values, index=years)
+                    consumption_data[region] = _to_series(series)
                 break
 
         return consumption_data
@@ -58,8 +211,7 @@ class CopperDataLoader:
         copper_file = self.base_data_path / 'Copper.json'
 
         try:
-            with open(copper_file, 'r') as f:
-                data = json.load(f)
+            data = self._load_json(copper_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"Copper data file not found: {copper_file}")
 
@@ -73,17 +225,25 @@ class CopperDataLoader:
         }
 
         segments = {}
+        remaining = set(segment_metrics)
         for metric in data.get('metrics', []):
-            if metric['name'] in segment_metrics:
+            if metric['name'] in remaining:
+                remaining.discard(metric['name'])
                 segment_name = segment_metrics[metric['name']]
                 segments[segment_name] = {}
                 for series in metric['data']:
                     region = series['region']
                     # Get most recent value
                     if series['values']:
-                        latest_value = series['values'][-1]['value']
+                        latest_value = series['values'][-1]
+                        if 'years' not in series:
+                            latest_value = latest_value['value']
                         segments[segment_name][region] = latest_value / 100.0  # Convert to fraction
 
+                # Stop scanning once every wanted metric has been read
+                if not remaining:
+                    break
+
         return segments
 
     def load_vehicle_data(self, vehicle_type='Passenger_Cars'):
@@ -96,42 +256,29 @@ class CopperDataLoader:
         vehicle_file = self.base_data_path / f'{vehicle_type}.json'
 
         try:
-            with open(vehicle_file, 'r') as f:
-                data = json.load(f)
+            data = self._load_json(vehicle_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"Vehicle data file not found: {vehicle_file}")
 
         # Extract sales and fleet data by powertrain
         vehicle_data = {'sales': {}, 'fleet': {}}
+        sales, fleet = vehicle_data['sales'], vehicle_data['fleet']
 
         for metric in data.get('metrics', []):
             metric_name = metric['name']
 
-            # Sales data
+            # Pick the target once per metric, then fill it series by series
             if 'Annual_Sales' in metric_name:
-                for series in metric['data']:
-                    region = series['region']
-                    powertrain = series.get('powertrain', 'ICE')
-
-                    if region not in vehicle_data['sales']:
-                        vehicle_data['sales'][region] = {}
-
-                    years = [point['year'] for point in series['values']]
-                    values = [point['value'] for point in series['values']]
-                    vehicle_data['sales'][region][powertrain] = pd.Series(values, index=years)
-
-            # Fleet data
+                target = sales
             elif 'Total_Fleet' in metric_name:
-                for series in metric['data']:
-                    region = series['region']
-                    powertrain = series.get('powertrain', 'ICE')
-
-                    if region not in vehicle_data['fleet']:
-                        vehicle_data['fleet'][region] = {}
+                target = fleet
+            else:
+                continue
 
-                    years = [point['year'] for point in series['values']]
-                    values = [point['value'] for point in series['values']]
-                    vehicle_data['fleet'][region][powertrain] = pd.Series(values, index=years)
+            for series in metric['data']:
+                region = series['region']
+                powertrain = series.get('powertrain', 'ICE')
+                target.setdefault(region, {})[powertrain] = _to_series(series)
 
         return vehicle_data
 
@@ -140,8 +287,7 @@ class CopperDataLoader:
         energy_file = self.base_data_path / 'Energy_Generation.json'
 
         try:
-            with open(energy_file, 'r') as f:
-                data = json.load(f)
+            data = self._load_json(energy_file)
         except FileNotFoundError:
             raise FileNotFoundError(f"Energy data file not found: {energy_file}")
 
@@ -155,16 +301,19 @@ class CopperDataLoader:
         }
 
         capacity_data = {}
+        remaining = set(capacity_metrics)
         for metric in data.get('metrics', []):
-            if metric['name'] in capacity_metrics:
+            if metric['name'] in remaining:
+                remaining.discard(metric['name'])
                 tech_name = capacity_metrics[metric['name']]
                 capacity_data[tech_name] = {}
 
                 for series in metric['data']:
                     region = series['region']
-                    years = [point['year'] for point in series['values']]
-                    values = [point['value'] for point in series['values']]
-                    capacity_data[tech_name][region] = pd.Series(values, index=years)
+                    capacity_data[tech_name][region] = _to_series(series)
+
+                if not remaining:
+                    break
 
         return capacity_data
 
@@ -185,10 +334,11 @@ class CopperDataLoader:
         if region not in consumption_data:
             raise ValueError(f"Region {region} not found in consumption data")
 
-        # Filter to requested years
+        # Filter to requested years (label slice: binary search on a sorted index)
         series = consumption_data[region]
-        mask = (series.index >= start_year) & (series.index <= end_year)
-        return series[mask]
+        if not series.index.is_monotonic_increasing:
+            series = series.sort_index()
+        return series.loc[start_year:end_year]
 
     def aggregate_to_global(self, regional_data):
         """
@@ -203,43 +353,117 @@ class CopperDataLoader:
         # Sum all regions except Global if it exists
         regions_to_sum = ['China', 'USA', 'Europe', 'Rest_of_World']
 
-        # Initialize with first region
-        result = None
-        for region in regions_to_sum:
-            if region in regional_data:
-                if result is None:
-                    result = regional_data[region].copy()
-                else:
-                    result = result.add(regional_data[region], fill_value=0)
+        columns = [regional_data[region] for region in regions_to_sum if region in regional_data]
+        if not columns:
+            return None
+
+        # One aligned frame over the union of years, then a single row sum
+        # (missing years count as 0; a year missing everywhere stays NaN)
+        return pd.concat(columns, axis=1, sort=True).sum(axis=1, min_count=1)
+
+    def _cache_file(self, data_files):
+        """
+        Pickle path in cache_dir for the current inputs, or None when not caching
+
+        The key covers the path, size and mtime of every input file and of this
+        module, so editing the data or the loader invalidates old pickles.
+        """
+        if self.cache_dir is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            for path in [Path(__file__), *data_files]:
+                stat = os.stat(path)
+                digest.update(f"{Path(path).resolve()}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        except OSError:
+            return None  # Missing input: let the load_* methods report it
 
-        return result
+        return self.cache_dir / f"copper_data_{digest.hexdigest()}.pkl"
 
-    def load_all_data(self, regions=None):
+    def _read_cache(self, cache_file):
+        """Load a cached load_all_data result, or None if absent/unreadable"""
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            print(f"Warning: Ignoring unreadable data cache {cache_file}: {e}")
+            return None
+
+    def _write_cache(self, cache_file, all_data):
+        """Store a load_all_data result; failures only cost the warm start"""
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(all_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)  # Atomic: readers never see a partial file
+        except OSError as e:
+            print(f"Warning: Could not write data cache {cache_file}: {e}")
+
+    def load_all_data(self, regions=None, lazy=False):
         """
         Load all required data for copper demand forecasting
 
         Args:
             regions: List of regions to load (default: all regions)
+            lazy: Return a LazyData that parses each section (and each vehicle
+                type) only when first read. Ignored when cache_dir is set,
+                since the pickle cache stores the full result.
 
         Returns:
-            dict with all loaded data
+            dict (or LazyData) with all loaded data
         """
         if regions is None:
             regions = self.regions
 
         print("Loading copper demand data...")
 
-        all_data = {
-            'consumption': self.load_copper_consumption(),
-            'segment_shares': self.load_segment_shares(),
-            'vehicles': {
-                'passenger_cars': self.load_vehicle_data('Passenger_Cars'),
-                'commercial_vehicles': self.load_vehicle_data('Commercial_Vehicle'),
-                'two_wheelers': self.load_vehicle_data('Two_Wheeler'),
-                'three_wheelers': self.load_vehicle_data('Three_Wheeler')
-            },
-            'generation': self.load_generation_capacity()
-        }
+        data_files = self.data_files()
+
+        cache_file = self._cache_file(data_files)
+        all_data = self._read_cache(cache_file) if cache_file is not None else None
+
+        if all_data is None and lazy and cache_file is None:
+            # Built once per loader; later callers share the extracted sections
+            if self._lazy_data is None:
+                self._lazy_data = LazyData({
+                    'consumption': self.load_copper_consumption,
+                    'segment_shares': self.load_segment_shares,
+                    'vehicles': partial(LazyData, {
+                        'passenger_cars': partial(self.load_vehicle_data, 'Passenger_Cars'),
+                        'commercial_vehicles': partial(self.load_vehicle_data, 'Commercial_Vehicle'),
+                        'two_wheelers': partial(self.load_vehicle_data, 'Two_Wheeler'),
+                        'three_wheelers': partial(self.load_vehicle_data, 'Three_Wheeler')
+                    }),
+                    'generation': self.load_generation_capacity
+                })
+            all_data = self._lazy_data
+
+            print(f"✓ Loaded consumption data for {len(all_data['consumption'])} regions")
+            print(f"✓ Vehicle and generation data will load on first use")
+            return all_data
+
+        if all_data is None:
+            # Overlap the file reads; extraction below then runs from the cache
+            self._prefetch_json(data_files)
+
+            all_data = {
+                'consumption': self.load_copper_consumption(),
+                'segment_shares': self.load_segment_shares(),
+                'vehicles': {
+                    'passenger_cars': self.load_vehicle_data('Passenger_Cars'),
+                    'commercial_vehicles': self.load_vehicle_data('Commercial_Vehicle'),
+                    'two_wheelers': self.load_vehicle_data('Two_Wheeler'),
+                    'three_wheelers': self.load_vehicle_data('Three_Wheeler')
+                },
+                'generation': self.load_generation_capacity()
+            }
+
+            if cache_file is not None:
+                self._write_cache(cache_file, all_data)
 
         print(f"✓ Loaded consumption data for {len(all_data['consumption'])} regions")
         print(f"✓ Loaded vehicle data for 4 vehicle types")
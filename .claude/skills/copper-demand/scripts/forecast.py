@@ -5,13 +5,71 @@ Implements hybrid bottom-up + top-down methodology
 """
 
 import json
+import os
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import argparse
+import contextlib
+import importlib.util
+import io
+import itertools
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from data_loader import CopperDataLoader
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+# TIER 2 columns scaled by the reconciliation factor (electronics_repl stays 0)
+TIER2_ADJUSTED_COLUMNS = (
+    'construction_total', 'construction_oem', 'construction_repl',
+    'grid_td_total', 'grid_td_oem', 'grid_td_repl',
+    'industrial_total', 'industrial_oem', 'industrial_repl',
+    'electronics_total', 'electronics_oem',
+    'other_uses'
+)
+
+# (CopperDataLoader, input file mtimes) per cache_dir, shared across models in this process
+_DATA_LOADERS = {}
+
+
+def shared_data_loader(cache_dir=None):
+    """
+    Process-wide CopperDataLoader for a cache_dir
+
+    Forecasting several regions/scenarios in one process (or one --sweep
+    worker) then parses each data file once. The loaded data is read-only
+    to the model. As with the config cache, a loader is only reused while
+    its input files keep their mtimes; edited data gets a fresh loader.
+    """
+    key = None if cache_dir is None else str(Path(cache_dir).resolve())
+    entry = _DATA_LOADERS.get(key)
+    if entry is None or entry[0].input_mtimes() != entry[1]:
+        loader = CopperDataLoader(cache_dir=cache_dir)
+        entry = _DATA_LOADERS[key] = (loader, loader.input_mtimes())
+    return entry[0]
+
+
+def _reconciliation_factors(auto_total, construction_total, grid_generation, grid_td_total,
+                            industrial_total, electronics_total, other_uses, total_consumption):
+    """
+    Per-year factor that rescales TIER 2 so all segments sum to total consumption.
+
+    1.0 (an exact no-op) in years already within 0.1% of the total, or with
+    no TIER 2 demand to scale.
+    """
+    total_calculated = (auto_total + construction_total + grid_generation + grid_td_total +
+                        industrial_total + electronics_total + other_uses)
+    tier1_total = auto_total + grid_generation
+    tier2_total = construction_total + grid_td_total + industrial_total + electronics_total + other_uses
+
+    adjust = (np.abs(total_calculated - total_consumption) > total_consumption * 0.001) & (tier2_total > 0)
+    return np.where(adjust, (total_consumption - tier1_total) / np.where(adjust, tier2_total, 1.0), 1.0)
+
+
 class CopperDemandForecast:
     """
     Hybrid copper demand forecasting model
@@ -19,16 +77,41 @@ class CopperDemandForecast:
     TIER 2: Top-down allocation for Construction, Industrial, Electronics
     """
 
-    def __init__(self, config_path, region='Global', scenario='baseline', end_year=None):
-        """Initialize with configuration"""
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+    # Parsed configs by (path, mtime), shared read-only by all instances
+    _config_cache = {}
+
+    def __init__(self, config_path, region='Global', scenario='baseline', end_year=None,
+                 data_cache_dir=None):
+        """Initialize with configuration (data_cache_dir: optional pickle cache for parsed input data)"""
+        self.config = self._load_config(config_path)
 
         self.start_year = self.config['default_parameters']['start_year']
         # Use passed end_year if provided, otherwise use config default
         self.end_year = end_year if end_year is not None else self.config['default_parameters']['end_year']
         self.coefficients = self.config['copper_coefficients']
         self.allocation = self.config['segment_allocation']
+
+        # Coefficients used on every forecast, flattened out of the nested config
+        auto = self.coefficients['automotive']
+        self._c_ice, self._c_bev, self._c_phev = auto['car_ice'], auto['car_bev'], auto['car_phev']
+        gen = self.coefficients['grid_generation']
+        self._c_wind_on = gen['per_mw_wind_onshore']
+        self._c_wind_off = gen['per_mw_wind_offshore']
+        self._c_solar = gen['per_mw_solar_pv']
+        self._c_gas = gen['per_mw_gas_ccgt']
+        self._c_coal = gen['per_mw_coal']
+        electrical = self.allocation['electrical_segments']
+        self._pct_construction = electrical['construction_pct']
+        self._pct_grid = electrical['grid_pct']
+        self._pct_industrial = electrical['industrial_pct']
+        self._pct_electronics = self.allocation['direct_shares']['electronics_pct']
+        bounds = self.allocation['other_uses_bounds']
+        self._other_uses_min_pct, self._other_uses_max_pct = bounds['min_pct'], bounds['max_pct']
+        splits = self.config['oem_replacement_splits']
+        self._split_construction_oem = splits['construction_oem_pct']
+        self._split_grid_td_oem = splits['grid_td_oem_pct']
+        self._split_industrial_oem = splits['industrial_oem_pct']
+
         self.lifespans = self.config['lifespans']
         self.region = region
         self.scenario_name = scenario
@@ -48,9 +131,12 @@ class CopperDemandForecast:
         self.years = list(range(self.start_year, self.end_year + 1))
         self.results = pd.DataFrame({'year': self.years})
 
-        # Initialize data loader
-        self.data_loader = CopperDataLoader()
+        # Data loader shared by all models in this process (see shared_data_loader)
+        self.data_loader = shared_data_loader(data_cache_dir)
         self.real_data = None
+        self.vehicle_data = None  # Passenger car sales/fleet, set by load_data
+        self.capacity_data = None  # Generation capacity, set by load_data
+        self.ev_sales_share = None  # Projected EV share of car sales, set by load_data
 
         # Confidence tags for transparency
         self.confidence = {
@@ -63,11 +149,26 @@ class CopperDemandForecast:
             'other_uses': 'LOW_RESIDUAL'
         }
 
+    @classmethod
+    def _load_config(cls, config_path):
+        """Parse a config file once per version; later instances reuse the dict"""
+        key = (str(Path(config_path).resolve()), os.stat(config_path).st_mtime_ns)
+        config = cls._config_cache.get(key)
+        if config is None:
+            if orjson is not None:
+                with open(config_path, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(config_path, 'r') as f:
+                    config = json.load(f)
+            cls._config_cache[key] = config
+        return config
+
     def load_data(self):
         """Load input datasets from real data sources"""
         try:
-            # Load all data
-            self.real_data = self.data_loader.load_all_data()
+            # Load all data (sections this model never reads are not parsed)
+            self.real_data = self.data_loader.load_all_data(lazy=True)
 
             # Get historical consumption baseline
             consumption_data = self.real_data['consumption']
@@ -80,21 +181,18 @@ class CopperDemandForecast:
                 last_hist_year = hist_series.index.max()
                 last_hist_value = hist_series.iloc[-1]
 
-                # Create consumption series
-                consumption_values = []
-                for year in self.years:
-                    if year <= last_hist_year and year in hist_series.index:
-                        # Use historical data
-                        consumption_values.append(hist_series[year])
-                    else:
-                        # Project forward with growth rate from scenario
-                        years_ahead = year - last_hist_year
-                        # Assume ~1.5% annual growth for baseline
-                        growth_rate = 0.015
-                        projected = last_hist_value * ((1 + growth_rate) ** years_ahead)
-                        consumption_values.append(projected)
-
-                self.total_consumption = pd.Series(consumption_values, index=self.years)
+                # Align history with the forecast years in one pass
+                years = np.asarray(self.years)
+                is_hist = np.isin(years, hist_series.index) & (years <= last_hist_year)
+                hist_values = hist_series.reindex(self.years).to_numpy(dtype=float)
+
+                # Project forward with growth rate from scenario
+                # Assume ~1.5% annual growth for baseline
+                growth_rate = 0.015
+                projected = last_hist_value * ((1 + growth_rate) ** (years - last_hist_year))
+
+                # Use historical data where available, projection elsewhere
+                self.total_consumption = pd.Series(np.where(is_hist, hist_values, projected), index=self.years)
             else:
                 # Fallback if region not found
                 print(f"Warning: No consumption data for {self.region}, using estimated values")
@@ -124,188 +222,202 @@ class CopperDemandForecast:
             self.share_electrical = 0.68
             self.share_ev = 0.02
 
-    def calculate_automotive(self, year):
+        # TIER 1 driver data, resolved once here so the calculations are plain
+        # arithmetic. Data files load lazily, so a missing or unreadable file
+        # surfaces now and only that segment falls back to its projection.
+        self.vehicle_data = self._driver_data('automotive', lambda data: data['vehicles']['passenger_cars'])
+        self.capacity_data = self._driver_data('generation', lambda data: data['generation'])
+
+        # EV share path for years without sales data, computed once per forecast
+        self.ev_sales_share = self._ev_sales_share()
+
+    def _driver_data(self, segment, select):
+        """Select one TIER 1 dataset from self.real_data, or None if it is unavailable"""
+        if self.real_data is None:
+            return None  # load_data already fell back to synthetic data
+        try:
+            return select(self.real_data)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: No {segment} data ({e}), using fallback projection")
+            return None
+
+    def _last_sales(self):
+        """(last_year, last_total, current_ev_share) of the region's car sales, or None"""
+        vehicle_data = self.vehicle_data
+        if vehicle_data is None or self.region not in vehicle_data['sales']:
+            return None
+        sales_data = vehicle_data['sales'][self.region]
+        all_ice = sales_data.get('ICE', pd.Series())
+        all_bev = sales_data.get('BEV', pd.Series())
+        if len(all_ice) == 0:
+            return None
+
+        last_year = max(all_ice.index.max(), all_bev.index.max())
+        last_ice = all_ice.get(last_year, 0)
+        last_bev = all_bev.get(last_year, 0)
+        last_total = last_ice + last_bev
+        current_ev_share = last_bev / last_total if last_total > 0 else 0.02
+        return last_year, last_total, current_ev_share
+
+    def _ev_sales_share(self):
+        """
+        Projected EV share of new car sales for every forecast year
+
+        After the last year of sales data the share follows a logistic
+        (Fisher-Pry) curve through the current share and the scenario target
+        at end_year. Its rate comes from those two points:
+        a = (logit(target) - logit(current)) / years_to_target, i.e. about
+        ln(target / current) / years_to_target while shares are small.
+        """
+        years = np.asarray(self.years)
+        last = self._last_sales()
+        if last is None:
+            # Complete fallback
+            return 0.02 + ((years - self.start_year) * 0.03)
+        last_year, _, current_ev_share = last
+
+        target_ev_share = self.scenario.get(f'ev_adoption_{self.end_year}', self.scenario.get('ev_adoption_2035', 0.75))
+        years_to_target = self.end_year - last_year
+        if years_to_target <= 0:
+            return np.full(len(years), float(target_ev_share))
+
+        # An S-curve needs a nonzero seed: start from at least the default 2%
+        # EV share, and keep both ends inside (0, 1) where the logit is finite
+        current = min(max(current_ev_share, 0.02), 1 - 1e-6)
+        target = min(max(target_ev_share, 1e-6), 1 - 1e-6)
+        logit_current = np.log(current / (1 - current))
+        a = (np.log(target / (1 - target)) - logit_current) / years_to_target
+        return 1 / (1 + np.exp(-(logit_current + a * (years - last_year))))
+
+    def calculate_automotive(self):
         """
         TIER 1: Bottom-up calculation for automotive segment
         Uses vehicle sales × copper coefficients with scenario-driven EV adoption
-        """
-        year_idx = year - self.start_year
 
-        try:
-            # Get vehicle data from real data
-            vehicle_data = self.real_data['vehicles']['passenger_cars']
-
-            # Get sales for region
-            if self.region in vehicle_data['sales']:
-                sales_data = vehicle_data['sales'][self.region]
-
-                # Use historical data if available
-                ice_sales = 0
-                bev_sales = 0
-                phev_sales = 0
-
-                if 'ICE' in sales_data and year in sales_data['ICE'].index:
-                    ice_sales = sales_data['ICE'][year]
-                if 'BEV' in sales_data and year in sales_data['BEV'].index:
-                    bev_sales = sales_data['BEV'][year]
-                if 'PHEV' in sales_data and year in sales_data['PHEV'].index:
-                    phev_sales = sales_data['PHEV'][year]
-
-                # If no data for this year, project using scenario
-                if ice_sales == 0 and bev_sales == 0:
-                    # Get last known year
-                    all_ice = sales_data.get('ICE', pd.Series())
-                    all_bev = sales_data.get('BEV', pd.Series())
-
-                    if len(all_ice) > 0:
-                        last_year = max(all_ice.index.max(), all_bev.index.max())
-                        last_ice = all_ice.get(last_year, 0)
-                        last_bev = all_bev.get(last_year, 0)
-                        last_total = last_ice + last_bev
-
-                        # Project using scenario EV adoption target
-                        target_ev_share = self.scenario.get(f'ev_adoption_{self.end_year}', self.scenario.get('ev_adoption_2035', 0.75))
-                        years_to_target = self.end_year - last_year
-                        years_from_last = year - last_year
-
-                        if years_to_target > 0:
-                            # Logistic curve for EV adoption
-                            current_ev_share = last_bev / last_total if last_total > 0 else 0.02
-                            progress = years_from_last / years_to_target
-                            ev_share = current_ev_share + (target_ev_share - current_ev_share) * progress
-                        else:
-                            ev_share = target_ev_share
-
-                        # Project total sales with modest growth
-                        total_sales = last_total * (1.01 ** years_from_last)
-                        bev_sales = total_sales * ev_share
-                        ice_sales = total_sales * (1 - ev_share)
-                    else:
-                        # Complete fallback
-                        total_sales = 70 + (year_idx * 0.5)
-                        ev_share_fallback = 0.02 + (year_idx * 0.03)
-                        bev_sales = total_sales * ev_share_fallback
-                        ice_sales = total_sales * (1 - ev_share_fallback)
+        Computed for all forecast years at once; returns per-year arrays.
+        """
+        years = np.asarray(self.years)
+        year_idx = years - self.start_year
+        ev_share = self.ev_sales_share
+
+        # Get sales for region
+        vehicle_data = self.vehicle_data
+        if vehicle_data is not None and self.region in vehicle_data['sales']:
+            sales_data = vehicle_data['sales'][self.region]
+
+            # Use historical data if available (0 for years without data)
+            def sales_for(powertrain):
+                if powertrain not in sales_data:
+                    return np.zeros(len(years))
+                return sales_data[powertrain].reindex(self.years, fill_value=0).to_numpy(dtype=float)
+
+            ice_sales = sales_for('ICE')
+            bev_sales = sales_for('BEV')
+            phev_sales = sales_for('PHEV')
+
+            # If no data for a year, project using scenario EV adoption
+            no_data = (ice_sales == 0) & (bev_sales == 0)
+            if no_data.any():
+                last = self._last_sales()
+                if last is not None:
+                    # Project total sales with modest growth from the last known year
+                    last_year, last_total, _ = last
+                    total_sales = last_total * (1.01 ** (years - last_year))
+                else:
+                    # Complete fallback
+                    total_sales = 70 + (year_idx * 0.5)
 
-            else:
-                # Fallback calculation
-                total_sales = 70 + (year_idx * 0.5)
-                ev_share_fallback = 0.02 + (year_idx * 0.03)
-                bev_sales = total_sales * ev_share_fallback
-                ice_sales = total_sales * (1 - ev_share_fallback)
-                phev_sales = 0
-
-            # Calculate copper demand (sales in millions, convert to tonnes)
-            ice_demand = ice_sales * self.coefficients['automotive']['car_ice'] * 1000000 / 1000
-            bev_demand = bev_sales * self.coefficients['automotive']['car_bev'] * 1000000 / 1000
-            phev_demand = phev_sales * self.coefficients['automotive']['car_phev'] * 1000000 / 1000 if phev_sales else 0
-
-            auto_total = ice_demand + bev_demand + phev_demand
-
-            return {
-                'auto_total': auto_total,
-                'auto_oem': auto_total,
-                'auto_repl': 0,
-                'auto_ice': ice_demand,
-                'auto_bev': bev_demand
-            }
+                bev_sales = np.where(no_data, total_sales * ev_share, bev_sales)
+                ice_sales = np.where(no_data, total_sales * (1 - ev_share), ice_sales)
 
-        except Exception as e:
-            print(f"Warning: Error in automotive calculation for {year}: {e}")
-            # Fallback calculation
-            ev_share = 0.02 + (year_idx * 0.03)
+        else:
+            # Fallback calculation (no sales data for this region)
             total_sales = 70 + (year_idx * 0.5)
-            ice_demand = total_sales * (1 - ev_share) * self.coefficients['automotive']['car_ice'] * 1000000 / 1000
-            bev_demand = total_sales * ev_share * self.coefficients['automotive']['car_bev'] * 1000000 / 1000
-
-            return {
-                'auto_total': ice_demand + bev_demand,
-                'auto_oem': ice_demand + bev_demand,
-                'auto_repl': 0,
-                'auto_ice': ice_demand,
-                'auto_bev': bev_demand
-            }
-
-    def calculate_grid_generation(self, year):
+            bev_sales = total_sales * ev_share
+            ice_sales = total_sales * (1 - ev_share)
+            phev_sales = np.zeros(len(years))
+
+        # Calculate copper demand (sales in millions × kg/vehicle: × 1e6 / 1000 = × 1000 tonnes)
+        ice_demand = ice_sales * self._c_ice * 1000
+        bev_demand = bev_sales * self._c_bev * 1000
+        phev_demand = phev_sales * self._c_phev * 1000
+
+        auto_total = ice_demand + bev_demand + phev_demand
+
+        return {
+            'auto_total': auto_total,
+            'auto_oem': auto_total,
+            'auto_repl': np.zeros(len(years), dtype=np.int64),
+            'auto_ice': ice_demand,
+            'auto_bev': bev_demand
+        }
+
+    def calculate_grid_generation(self):
         """
         TIER 1: Bottom-up calculation for grid generation
         Uses new capacity additions × copper coefficients with scenario-driven renewables buildout
-        """
-        year_idx = year - self.start_year
 
-        try:
-            # Get generation capacity data
-            capacity_data = self.real_data['generation']
-
-            # Calculate capacity additions (new capacity = delta from previous year)
-            new_wind_onshore = 0
-            new_wind_offshore = 0
-            new_solar = 0
-            new_gas = 0
-            new_coal = 0
+        Computed for all forecast years at once; returns per-year arrays.
+        """
+        years = np.asarray(self.years)
+        year_idx = years - self.start_year
+
+        # Scenario-driven renewables buildout, used where there is no capacity data
+        # (accelerated growth for renewables in accelerated scenario)
+        target_key = f'renewable_capacity_{self.end_year}_tw'
+        if target_key in self.scenario or 'renewable_capacity_2035_tw' in self.scenario:
+            target_tw = self.scenario.get(target_key, self.scenario.get('renewable_capacity_2035_tw', 15))
+            growth_factor = target_tw / 15.0  # Baseline is 15 TW
+            projected_wind = 50 * growth_factor + (year_idx * 5 * growth_factor)
+            projected_solar = 100 * growth_factor + (year_idx * 10 * growth_factor)
+        else:
+            projected_wind = 50 + (year_idx * 5)
+            projected_solar = 100 + (year_idx * 10)
+
+        def capacity_additions(series, projected):
+            """New capacity = delta from previous year, projected past the data"""
+            # Align once over [start_year - 1, end_year] and diff neighbouring years
+            extended_years = np.arange(self.start_year - 1, self.end_year + 1)
+            present = np.isin(extended_years, series.index)
+            delta = np.diff(series.reindex(extended_years).to_numpy(dtype=float))
+
+            has_both_years = present[1:] & present[:-1]
+            additions = np.where(delta > 0, delta, 0.0)  # max(0, delta); NaN -> 0
+            beyond_data = years > series.index.max()
+            return np.where(has_both_years, additions, np.where(beyond_data, projected, 0.0))
+
+        # Calculate capacity additions (0 where a year can't be derived)
+        new_wind_offshore = np.zeros(len(years))
+        capacity_data = self.capacity_data
+        if capacity_data is not None:
+            new_wind_onshore = np.zeros(len(years))
+            new_solar = np.zeros(len(years))
 
             if self.region in capacity_data.get('wind_onshore', {}):
-                wind_series = capacity_data['wind_onshore'][self.region]
-                if year in wind_series.index and year - 1 in wind_series.index:
-                    new_wind_onshore = max(0, wind_series[year] - wind_series[year-1])
-                elif year > wind_series.index.max():
-                    # Project using scenario
-                    last_year = wind_series.index.max()
-                    last_value = wind_series.iloc[-1]
-                    # Accelerated growth for renewables in accelerated scenario
-                    target_key = f'renewable_capacity_{self.end_year}_tw'
-                    if target_key in self.scenario or 'renewable_capacity_2035_tw' in self.scenario:
-                        target_tw = self.scenario.get(target_key, self.scenario.get('renewable_capacity_2035_tw', 15))
-                        growth_factor = target_tw / 15.0  # Baseline is 15 TW
-                        new_wind_onshore = 50 * growth_factor + (year_idx * 5 * growth_factor)
-                    else:
-                        new_wind_onshore = 50 + (year_idx * 5)
+                new_wind_onshore = capacity_additions(capacity_data['wind_onshore'][self.region], projected_wind)
 
             if self.region in capacity_data.get('solar', {}):
-                solar_series = capacity_data['solar'][self.region]
-                if year in solar_series.index and year - 1 in solar_series.index:
-                    new_solar = max(0, solar_series[year] - solar_series[year-1])
-                elif year > solar_series.index.max():
-                    # Project using scenario
-                    target_key = f'renewable_capacity_{self.end_year}_tw'
-                    if target_key in self.scenario or 'renewable_capacity_2035_tw' in self.scenario:
-                        target_tw = self.scenario.get(target_key, self.scenario.get('renewable_capacity_2035_tw', 15))
-                        growth_factor = target_tw / 15.0
-                        new_solar = 100 * growth_factor + (year_idx * 10 * growth_factor)
-                    else:
-                        new_solar = 100 + (year_idx * 10)
-
-            # Fossil fuels declining
-            new_gas = max(0, 20 - (year_idx * 0.5))
-            new_coal = max(0, 10 - (year_idx * 0.3))
+                new_solar = capacity_additions(capacity_data['solar'][self.region], projected_solar)
 
             # If no real data, use scenario-based projections
-            if new_wind_onshore == 0 and new_solar == 0:
-                target_key = f'renewable_capacity_{self.end_year}_tw'
-                if target_key in self.scenario or 'renewable_capacity_2035_tw' in self.scenario:
-                    target_tw = self.scenario.get(target_key, self.scenario.get('renewable_capacity_2035_tw', 15))
-                    growth_factor = target_tw / 15.0
-                    new_wind_onshore = 50 * growth_factor + (year_idx * 5 * growth_factor)
-                    new_solar = 100 * growth_factor + (year_idx * 10 * growth_factor)
-                else:
-                    new_wind_onshore = 50 + (year_idx * 5)
-                    new_solar = 100 + (year_idx * 10)
-
-        except Exception as e:
-            print(f"Warning: Error in generation calculation for {year}: {e}")
-            # Fallback
+            no_data = (new_wind_onshore == 0) & (new_solar == 0)
+            new_wind_onshore = np.where(no_data, projected_wind, new_wind_onshore)
+            new_solar = np.where(no_data, projected_solar, new_solar)
+        else:
+            # Fallback (generation data could not be loaded)
             new_wind_onshore = 50 + (year_idx * 5)
-            new_wind_offshore = 0
             new_solar = 100 + (year_idx * 10)
-            new_gas = max(0, 20 - (year_idx * 0.5))
-            new_coal = max(0, 10 - (year_idx * 0.3))
+
+        # Fossil fuels declining
+        new_gas = np.maximum(0, 20 - (year_idx * 0.5))
+        new_coal = np.maximum(0, 10 - (year_idx * 0.3))
 
         # Calculate copper demand (GW to MW, then × coefficients)
-        wind_copper = (new_wind_onshore * 1000 * self.coefficients['grid_generation']['per_mw_wind_onshore'] +
-                      new_wind_offshore * 1000 * self.coefficients['grid_generation']['per_mw_wind_offshore'])
-        solar_copper = new_solar * 1000 * self.coefficients['grid_generation']['per_mw_solar_pv']
-        gas_copper = new_gas * 1000 * self.coefficients['grid_generation']['per_mw_gas_ccgt']
-        coal_copper = new_coal * 1000 * self.coefficients['grid_generation']['per_mw_coal']
+        wind_copper = (new_wind_onshore * 1000 * self._c_wind_on +
+                      new_wind_offshore * 1000 * self._c_wind_off)
+        solar_copper = new_solar * 1000 * self._c_solar
+        gas_copper = new_gas * 1000 * self._c_gas
+        coal_copper = new_coal * 1000 * self._c_coal
 
         grid_gen_total = wind_copper + solar_copper + gas_copper + coal_copper
 
@@ -316,33 +428,38 @@ class CopperDemandForecast:
             'grid_gen_fossil': gas_copper + coal_copper
         }
 
-    def allocate_tier2_segments(self, year, total_consumption, auto_total, grid_gen_total):
+    def allocate_tier2_segments(self, total_consumption, auto_total, grid_gen_total):
         """
         TIER 2: Top-down allocation for Construction, Industrial, Electronics
         Uses segment shares when driver data unavailable
+
+        All arguments are per-year arrays aligned with self.years.
         """
+        n_years = len(total_consumption)
+
         # Calculate electrical segment total
         electrical_total = total_consumption * self.share_electrical
 
         # Allocate within electrical segment
-        construction_total = electrical_total * self.allocation['electrical_segments']['construction_pct']
-        grid_total_allocated = electrical_total * self.allocation['electrical_segments']['grid_pct']
-        industrial_total = electrical_total * self.allocation['electrical_segments']['industrial_pct']
+        construction_total = electrical_total * self._pct_construction
+        grid_total_allocated = electrical_total * self._pct_grid
+        industrial_total = electrical_total * self._pct_industrial
 
-        # Grid T&D is residual after generation
-        grid_td_total = max(0, grid_total_allocated - grid_gen_total)
+        # Grid T&D is residual after generation (floored at 0)
+        grid_td_residual = grid_total_allocated - grid_gen_total
+        grid_td_total = np.where(grid_td_residual > 0, grid_td_residual, 0.0)
 
         # Electronics as fixed share
-        electronics_total = total_consumption * self.allocation['direct_shares']['electronics_pct']
+        electronics_total = total_consumption * self._pct_electronics
 
         # Apply OEM/Replacement splits
-        construction_oem = construction_total * self.config['oem_replacement_splits']['construction_oem_pct']
+        construction_oem = construction_total * self._split_construction_oem
         construction_repl = construction_total - construction_oem
 
-        grid_td_oem = grid_td_total * self.config['oem_replacement_splits']['grid_td_oem_pct']
+        grid_td_oem = grid_td_total * self._split_grid_td_oem
         grid_td_repl = grid_td_total - grid_td_oem
 
-        industrial_oem = industrial_total * self.config['oem_replacement_splits']['industrial_oem_pct']
+        industrial_oem = industrial_total * self._split_industrial_oem
         industrial_repl = industrial_total - industrial_oem
 
         # Other uses as bounded residual
@@ -351,8 +468,8 @@ class CopperDemandForecast:
                                               industrial_total + electronics_total)
 
         # Apply bounds
-        other_uses_min = total_consumption * self.allocation['other_uses_bounds']['min_pct']
-        other_uses_max = total_consumption * self.allocation['other_uses_bounds']['max_pct']
+        other_uses_min = total_consumption * self._other_uses_min_pct
+        other_uses_max = total_consumption * self._other_uses_max_pct
         other_uses = np.clip(other_uses_raw, other_uses_min, other_uses_max)
 
         return {
@@ -367,133 +484,112 @@ class CopperDemandForecast:
             'industrial_repl': industrial_repl,
             'electronics_total': electronics_total,
             'electronics_oem': electronics_total,  # All OEM for electronics
-            'electronics_repl': 0,
+            'electronics_repl': np.zeros(n_years, dtype=np.int64),
             'other_uses': other_uses
         }
 
-    def reconcile_and_validate(self, year_results, total_consumption):
+    def reconcile_and_validate(self, results, total_consumption):
         """
         Force reconciliation to match total consumption
         Apply scenario demand multipliers
         Validate against segment shares
+
+        Works on a dict of per-year column arrays; returns it updated.
         """
         # Apply scenario demand multiplier if specified
         if 'demand_multiplier' in self.scenario:
             multiplier = self.scenario['demand_multiplier']
-            total_consumption *= multiplier
+            total_consumption = total_consumption * multiplier
 
         # Apply substitution scenario coefficient reductions if specified
         if 'coefficient_reduction' in self.scenario:
             reduction = self.scenario['coefficient_reduction']
             # Reduce construction and grid T&D (vulnerable to substitution)
-            year_results['construction_total'] *= (1 - reduction)
-            year_results['construction_oem'] *= (1 - reduction)
-            year_results['construction_repl'] *= (1 - reduction)
-            year_results['grid_td_total'] *= (1 - reduction)
-            year_results['grid_td_oem'] *= (1 - reduction)
-            year_results['grid_td_repl'] *= (1 - reduction)
-
-        # Calculate total from segments
-        total_calculated = (
-            year_results['auto_total'] +
-            year_results['construction_total'] +
-            year_results['grid_generation_oem'] +
-            year_results['grid_td_total'] +
-            year_results['industrial_total'] +
-            year_results['electronics_total'] +
-            year_results['other_uses']
+            results['construction_total'] = results['construction_total'] * (1 - reduction)
+            results['construction_oem'] = results['construction_oem'] * (1 - reduction)
+            results['construction_repl'] = results['construction_repl'] * (1 - reduction)
+            results['grid_td_total'] = results['grid_td_total'] * (1 - reduction)
+            results['grid_td_oem'] = results['grid_td_oem'] * (1 - reduction)
+            results['grid_td_repl'] = results['grid_td_repl'] * (1 - reduction)
+
+        # Force reconciliation in the years that need it
+        adjustment_factor = _reconciliation_factors(
+            results['auto_total'],
+            results['construction_total'],
+            results['grid_generation_oem'],
+            results['grid_td_total'],
+            results['industrial_total'],
+            results['electronics_total'],
+            results['other_uses'],
+            total_consumption
         )
 
-        # Force reconciliation if needed
-        if abs(total_calculated - total_consumption) > total_consumption * 0.001:
-            # Adjust TIER 2 segments proportionally
-            tier2_total = (year_results['construction_total'] +
-                          year_results['grid_td_total'] +
-                          year_results['industrial_total'] +
-                          year_results['electronics_total'] +
-                          year_results['other_uses'])
-
-            tier1_total = year_results['auto_total'] + year_results['grid_generation_oem']
-
-            if tier2_total > 0:
-                adjustment_factor = (total_consumption - tier1_total) / tier2_total
-
-                # Apply adjustment
-                for key in ['construction_total', 'construction_oem', 'construction_repl',
-                           'grid_td_total', 'grid_td_oem', 'grid_td_repl',
-                           'industrial_total', 'industrial_oem', 'industrial_repl',
-                           'electronics_total', 'electronics_oem',
-                           'other_uses']:
-                    if key in year_results:
-                        year_results[key] *= adjustment_factor
+        # Adjust TIER 2 segments proportionally, as one (years x columns) multiply
+        tier2_block = np.column_stack([results[key] for key in TIER2_ADJUSTED_COLUMNS])
+        tier2_block *= adjustment_factor[:, None]
+        results.update(zip(TIER2_ADJUSTED_COLUMNS, tier2_block.T))
 
         # Calculate validation metrics
-        year_results['total_demand'] = total_consumption
-        year_results['share_transport_calc'] = year_results['auto_total'] / total_consumption if total_consumption > 0 else 0
-        year_results['share_ev_calc'] = year_results.get('auto_bev', 0) / total_consumption if total_consumption > 0 else 0
+        has_total = total_consumption > 0
+        results['total_demand'] = total_consumption
+        results['share_transport_calc'] = np.divide(results['auto_total'], total_consumption,
+                                                    out=np.zeros(len(total_consumption)), where=has_total)
+        results['share_ev_calc'] = np.divide(results['auto_bev'], total_consumption,
+                                             out=np.zeros(len(total_consumption)), where=has_total)
 
-        return year_results
+        return results
 
     def run_forecast(self):
         """Run the complete forecast"""
         self.load_data()
 
-        all_results = []
+        print(f"Processing years {self.start_year} to {self.end_year}...")
 
-        for year in self.years:
-            print(f"Processing year {year}...")
-
-            # Get total consumption for this year
-            total_consumption = self.total_consumption[year]
-
-            # TIER 1: Bottom-up calculations
-            auto_results = self.calculate_automotive(year)
-            grid_gen_results = self.calculate_grid_generation(year)
-
-            # TIER 2: Top-down allocation
-            tier2_results = self.allocate_tier2_segments(
-                year,
-                total_consumption,
-                auto_results['auto_total'],
-                grid_gen_results['grid_generation_oem']
-            )
-
-            # Combine results
-            year_results = {
-                'year': year,
-                **auto_results,
-                **grid_gen_results,
-                **tier2_results
-            }
+        # Everything below works on whole columns (one array per field)
+        # TIER 1: Bottom-up calculations
+        results = {
+            'year': np.asarray(self.years),
+            **self.calculate_automotive(),
+            **self.calculate_grid_generation()
+        }
 
-            # Reconcile and validate
-            year_results = self.reconcile_and_validate(year_results, total_consumption)
+        # Get total consumption for each year
+        total_consumption = self.total_consumption.reindex(self.years).to_numpy(dtype=float)
 
-            # Add confidence tags
-            for segment, confidence in self.confidence.items():
-                year_results[f'{segment}_confidence'] = confidence
+        # TIER 2: Top-down allocation
+        results.update(self.allocate_tier2_segments(
+            total_consumption,
+            results['auto_total'],
+            results['grid_generation_oem']
+        ))
 
-            all_results.append(year_results)
+        # Reconcile and validate
+        results = self.reconcile_and_validate(results, total_consumption)
 
-        # Create results dataframe
-        self.results = pd.DataFrame(all_results)
+        # Add confidence tags (constant per column: one category, int8 codes)
+        tag_codes = np.zeros(len(self.years), dtype=np.int8)
+        for segment, confidence in self.confidence.items():
+            results[f'{segment}_confidence'] = pd.Categorical.from_codes(tag_codes, categories=[confidence])
 
         # Add aggregate columns
-        self.results['total_oem'] = (
-            self.results['auto_oem'] +
-            self.results['grid_generation_oem'] +
-            self.results['grid_td_oem'] +
-            self.results['construction_oem'] +
-            self.results['industrial_oem'] +
-            self.results['electronics_oem']
+        results['total_oem'] = (
+            results['auto_oem'] +
+            results['grid_generation_oem'] +
+            results['grid_td_oem'] +
+            results['construction_oem'] +
+            results['industrial_oem'] +
+            results['electronics_oem']
         )
 
-        self.results['total_replacement'] = (
-            self.results['grid_td_repl'] +
-            self.results['construction_repl'] +
-            self.results['industrial_repl']
+        results['total_replacement'] = (
+            results['grid_td_repl'] +
+            results['construction_repl'] +
+            results['industrial_repl']
         )
 
+        # Create results dataframe in one go from the finished columns
+        self.results = pd.DataFrame(results)
+
         print(f"Forecast complete for {len(self.years)} years")
 
         return self.results
@@ -506,20 +602,88 @@ class CopperDemandForecast:
         elif format == 'json':
             self.results.to_json(output_path, orient='records', indent=2)
             print(f"Results saved to {output_path}")
+        elif format == 'parquet':
+            # Typed, compressed columnar output (needs pyarrow, see requirements.txt)
+            try:
+                self.results.to_parquet(output_path, index=False, compression='zstd')
+            except ImportError as e:
+                raise ImportError("Parquet output requires pyarrow (pip install pyarrow); "
+                                  "use csv or json output instead") from e
+            print(f"Results saved to {output_path}")
 
     def generate_summary(self):
         """Generate summary statistics"""
+        # Rows run start_year..end_year in order, so the end year is the last row
+        total_demand = self.results['total_demand']
         summary = {
             'region': self.region,
             'scenario': self.scenario_name,
-            f'total_demand_{self.end_year}': self.results[self.results['year'] == self.end_year]['total_demand'].values[0],
-            f'auto_share_{self.end_year}': self.results[self.results['year'] == self.end_year]['share_transport_calc'].values[0],
-            f'ev_share_{self.end_year}': self.results[self.results['year'] == self.end_year]['share_ev_calc'].values[0],
-            'cagr': (self.results['total_demand'].iloc[-1] / self.results['total_demand'].iloc[0]) ** (1/len(self.years)) - 1
+            f'total_demand_{self.end_year}': total_demand.iat[-1],
+            f'auto_share_{self.end_year}': self.results['share_transport_calc'].iat[-1],
+            f'ev_share_{self.end_year}': self.results['share_ev_calc'].iat[-1],
+            'cagr': (total_demand.iat[-1] / total_demand.iat[0]) ** (1/len(self.years)) - 1
         }
         return summary
 
 
+def run_one(config_path, region, scenario, end_year, output_format, data_cache_dir=None, quiet=False):
+    """
+    Run one (region, scenario) forecast and save it under output/
+
+    Module-level so --sweep can hand it to worker processes.
+
+    Args:
+        quiet: Suppress the model's progress output
+
+    Returns:
+        (output_file, summary)
+    """
+    with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+        model = CopperDemandForecast(
+            config_path,
+            region=region,
+            scenario=scenario,
+            end_year=end_year,
+            data_cache_dir=data_cache_dir
+        )
+        model.run_forecast()
+
+        # Save results with region and scenario in filename
+        output_file = Path('output') / f'copper_demand_{region}_{scenario}_{end_year}.{output_format}'
+        model.save_results(output_file, format=output_format)
+
+    return output_file, model.generate_summary()
+
+
+def run_sweep(args):
+    """Run every region × scenario in the config in parallel, one process per forecast"""
+    config = CopperDemandForecast._load_config(args.config)
+    runs = list(itertools.product(config['regions'], config['scenarios']))
+    print(f"Running {len(runs)} forecasts ({len(config['regions'])} regions × "
+          f"{len(config['scenarios'])} scenarios) to {args.end_year}...")
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=min(len(runs), os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(run_one, args.config, region, scenario, args.end_year,
+                            args.output_format, args.data_cache_dir, True)
+            for region, scenario in runs
+        ]
+
+        # Report in submission order so the log is deterministic
+        for (region, scenario), future in zip(runs, futures):
+            try:
+                output_file, summary = future.result()
+            except Exception as e:
+                print(f"⚠ {region}/{scenario}: {e}")
+                failures += 1
+                continue
+            print(f"✓ {region}/{scenario}: {summary[f'total_demand_{args.end_year}']:,.0f} tonnes "
+                  f"in {args.end_year}, CAGR {summary['cagr']:.2%} -> {output_file}")
+
+    return 1 if failures else 0
+
+
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(description='Copper Demand Forecast')
@@ -527,31 +691,42 @@ def main():
     parser.add_argument('--region', default='Global', help='Region: China, USA, Europe, Rest_of_World, Global')
     parser.add_argument('--end-year', type=int, default=2035, help='End year for forecast')
     parser.add_argument('--scenario', default='baseline', help='Scenario: baseline, accelerated, delayed, substitution')
-    parser.add_argument('--output-format', default='csv', choices=['csv', 'json'], help='Output format')
+    parser.add_argument('--output-format', default='csv', choices=['csv', 'json', 'parquet'],
+                        help='Output format (parquet requires pyarrow)')
     parser.add_argument('--validate', type=bool, default=False, help='Run validation')
+    parser.add_argument('--data-cache-dir', default=None,
+                        help='Directory to cache parsed input data between runs (default: no cache)')
+    parser.add_argument('--sweep', action='store_true',
+                        help='Run every region × scenario in the config in parallel (ignores --region/--scenario)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress progress output and print only the summary (always on for --sweep workers)')
 
     args = parser.parse_args()
 
+    # Fail before forecasting rather than when the results are saved
+    if args.output_format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        parser.error("--output-format parquet requires pyarrow (pip install pyarrow); use csv or json instead")
+
     # Create output directory
     output_dir = Path('output')
     output_dir.mkdir(exist_ok=True)
 
+    if args.sweep:
+        return run_sweep(args)
+
     # Run forecast with region and scenario
     try:
-        model = CopperDemandForecast(
+        output_file, summary = run_one(
             args.config,
-            region=args.region,
-            scenario=args.scenario,
-            end_year=args.end_year
+            args.region,
+            args.scenario,
+            args.end_year,
+            args.output_format,
+            data_cache_dir=args.data_cache_dir,
+            quiet=args.quiet
         )
-        results = model.run_forecast()
-
-        # Save results with region and scenario in filename
-        output_file = output_dir / f'copper_demand_{args.region}_{args.scenario}_{args.end_year}.{args.output_format}'
-        model.save_results(output_file, format=args.output_format)
 
-        # Generate summary
-        summary = model.generate_summary()
+        # Print summary
         print("\n=== FORECAST SUMMARY ===")
         print(f"Region: {summary['region']}")
         print(f"Scenario: {summary['scenario']}")
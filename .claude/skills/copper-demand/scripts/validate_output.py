@@ -3,11 +3,13 @@
 Validate forecast output for data quality and consistency
 """
 
-import json
 import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from validate_scenario import load_config
+
 
 def validate_output(filepath, config_path='config.json'):
     """
@@ -25,91 +27,115 @@ def validate_output(filepath, config_path='config.json'):
 
     # Load config for validation rules
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         validation_rules = config.get('validation_rules', {})
     except:
         validation_rules = {}
         warnings.append("Could not load validation rules from config")
 
+    required_cols = ['year', 'total_demand', 'auto_total', 'construction_total',
+                    'grid_generation_oem', 'grid_td_total', 'industrial_total',
+                    'electronics_total', 'other_uses']
+    checked_cols = set(required_cols) | {'share_transport_calc'}
+
     # Load data
     try:
         if filepath.endswith('.csv'):
-            data = pd.read_csv(filepath)
+            # Only parse the columns the checks below read (OEM/replacement splits,
+            # confidence tags etc. are skipped)
+            data = pd.read_csv(filepath, usecols=lambda col: col in checked_cols)
         elif filepath.endswith('.json'):
             data = pd.read_json(filepath)
+        elif filepath.endswith('.parquet'):
+            data = pd.read_parquet(filepath)
         else:
-            return False, "File must be .csv or .json"
+            return False, "File must be .csv, .json or .parquet"
     except Exception as e:
         return False, f"Could not read file: {e}"
 
     # Check required columns
-    required_cols = ['year', 'total_demand', 'auto_total', 'construction_total',
-                    'grid_generation_oem', 'grid_td_total', 'industrial_total',
-                    'electronics_total', 'other_uses']
-
     missing_cols = [col for col in required_cols if col not in data.columns]
     if missing_cols:
         errors.append(f"Missing required columns: {', '.join(missing_cols)}")
         return False, "\n".join(errors)
 
-    # Validate each year
-    for idx, row in data.iterrows():
-        year = row['year']
+    # Validate each year: checks run column-wise, messages are built for flagged years only
+    years = data['year'].to_numpy()
+    total = data['total_demand'].to_numpy(dtype=float)
+    has_total = total > 0
+
+    # 1. Reconciliation check
+    segments_sum = (data['auto_total'].to_numpy(dtype=float) +
+                    data['grid_generation_oem'].to_numpy(dtype=float) +
+                    data['construction_total'].to_numpy(dtype=float) +
+                    data['grid_td_total'].to_numpy(dtype=float) +
+                    data['industrial_total'].to_numpy(dtype=float) +
+                    data['electronics_total'].to_numpy(dtype=float) +
+                    data['other_uses'].to_numpy(dtype=float))
+
+    reconciliation_error = np.divide(np.abs(segments_sum - total), total,
+                                     out=np.zeros(len(total)), where=has_total)
+    unreconciled = reconciliation_error > 0.001  # 0.1% tolerance
+
+    # 2. Check for negative values
+    value_cols = required_cols[1:]  # Skip 'year'
+    negative = data[value_cols].to_numpy(dtype=float) < 0
+
+    # 3. Check segment shares
+    auto_share = np.divide(data['auto_total'].to_numpy(dtype=float), total,
+                           out=np.zeros(len(total)), where=has_total)
+    if 'share_transport_calc' in data.columns:
+        reported_share = data['share_transport_calc'].to_numpy(dtype=float)
+        share_mismatch = has_total & (np.abs(auto_share - reported_share) > 0.01)
+    else:
+        share_mismatch = np.zeros(len(total), dtype=bool)
 
-        # 1. Reconciliation check
-        segments_sum = (row['auto_total'] +
-                       row['grid_generation_oem'] +
-                       row['construction_total'] +
-                       row['grid_td_total'] +
-                       row['industrial_total'] +
-                       row['electronics_total'] +
-                       row['other_uses'])
+    # 4. Check for unrealistic values
+    very_high = total > 100_000_000  # 100 Mt seems unrealistic
+    very_low = (total < 10_000_000) & (years > 2020)  # 10 Mt seems too low
 
-        total = row['total_demand']
-        reconciliation_error = abs(segments_sum - total) / total if total > 0 else 0
+    flagged = np.flatnonzero(unreconciled | negative.any(axis=1) | share_mismatch | very_high | very_low)
+    for i in flagged:
+        year = years[i]
 
-        if reconciliation_error > 0.001:  # 0.1% tolerance
-            errors.append(f"Year {year}: Reconciliation error {reconciliation_error:.4%} (segments sum: {segments_sum:,.0f}, total: {total:,.0f})")
+        if unreconciled[i]:
+            errors.append(f"Year {year}: Reconciliation error {reconciliation_error[i]:.4%} (segments sum: {segments_sum[i]:,.0f}, total: {total[i]:,.0f})")
 
-        # 2. Check for negative values
-        for col in required_cols[1:]:  # Skip 'year'
-            if row[col] < 0:
-                errors.append(f"Year {year}: Negative value in {col}: {row[col]}")
+        for j in np.flatnonzero(negative[i]):
+            col = value_cols[j]
+            errors.append(f"Year {year}: Negative value in {col}: {data[col].iat[i]}")
 
-        # 3. Check segment shares
-        if total > 0:
-            auto_share = row['auto_total'] / total
-            if 'share_transport_calc' in data.columns:
-                if abs(auto_share - row['share_transport_calc']) > 0.01:
-                    warnings.append(f"Year {year}: Transport share mismatch (calculated: {auto_share:.3f}, reported: {row['share_transport_calc']:.3f})")
+        if share_mismatch[i]:
+            warnings.append(f"Year {year}: Transport share mismatch (calculated: {auto_share[i]:.3f}, reported: {reported_share[i]:.3f})")
 
-        # 4. Check for unrealistic values
-        if total > 100_000_000:  # 100 Mt seems unrealistic
-            warnings.append(f"Year {year}: Very high total demand {total:,.0f} tonnes")
+        if very_high[i]:
+            warnings.append(f"Year {year}: Very high total demand {total[i]:,.0f} tonnes")
 
-        if total < 10_000_000 and year > 2020:  # 10 Mt seems too low
-            warnings.append(f"Year {year}: Very low total demand {total:,.0f} tonnes")
+        if very_low[i]:
+            warnings.append(f"Year {year}: Very low total demand {total[i]:,.0f} tonnes")
 
     # 5. Check growth rates
     if len(data) > 1:
         data_sorted = data.sort_values('year')
-        for i in range(1, len(data_sorted)):
-            prev_total = data_sorted.iloc[i-1]['total_demand']
-            curr_total = data_sorted.iloc[i]['total_demand']
-
-            if prev_total > 0:
-                growth = (curr_total - prev_total) / prev_total
-
-                # Check against growth guards if available
-                max_growth = validation_rules.get('growth_guards', {}).get('max_yoy_growth_pct', 50) / 100
-                max_decline = validation_rules.get('growth_guards', {}).get('max_yoy_decline_pct', -30) / 100
-
-                if growth > max_growth:
-                    warnings.append(f"Year {data_sorted.iloc[i]['year']}: High growth {growth:.1%} (max: {max_growth:.1%})")
-
-                if growth < max_decline:
-                    warnings.append(f"Year {data_sorted.iloc[i]['year']}: Large decline {growth:.1%} (min: {max_decline:.1%})")
+        sorted_years = data_sorted['year'].to_numpy()
+        sorted_total = data_sorted['total_demand'].to_numpy(dtype=float)
+        prev_total, curr_total = sorted_total[:-1], sorted_total[1:]
+
+        # Growth is only defined where the previous year has demand
+        growth = np.divide(curr_total - prev_total, prev_total,
+                           out=np.full(len(prev_total), np.nan), where=prev_total > 0)
+
+        # Check against growth guards if available
+        growth_guards = validation_rules.get('growth_guards', {})
+        max_growth = growth_guards.get('max_yoy_growth_pct', 50) / 100
+        max_decline = growth_guards.get('max_yoy_decline_pct', -30) / 100
+
+        for i in np.flatnonzero((growth > max_growth) | (growth < max_decline)):
+            year = sorted_years[i + 1]
+            if growth[i] > max_growth:
+                warnings.append(f"Year {year}: High growth {growth[i]:.1%} (max: {max_growth:.1%})")
+            else:
+                warnings.append(f"Year {year}: Large decline {growth[i]:.1%} (min: {max_decline:.1%})")
 
     # 6. Check data completeness
     if len(data) < 20:
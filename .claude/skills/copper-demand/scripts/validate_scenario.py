@@ -4,9 +4,38 @@ Validate scenario parameters before running forecast
 """
 
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+
+@lru_cache(maxsize=16)
+def _parse_config(path, mtime_ns):
+    """Parse a config file; memoized per (absolute path, mtime) version"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_config(config_path):
+    """
+    Load a config file, reusing the parsed dict while the file is unchanged
+
+    Batch validation (many scenarios or output files) shares one parse per
+    config version, so callers must not mutate the returned dict.
+    """
+    path = os.path.abspath(config_path)
+    return _parse_config(path, os.stat(path).st_mtime_ns)
+
 
 def validate_scenario(config_path, scenario_name):
     """
@@ -15,8 +44,7 @@ def validate_scenario(config_path, scenario_name):
     Returns: (valid, error_message)
     """
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = load_config(config_path)
     except FileNotFoundError:
         return False, f"Config file not found: {config_path}"
     except json.JSONDecodeError as e:
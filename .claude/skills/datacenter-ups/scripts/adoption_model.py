@@ -77,24 +77,18 @@ class AdoptionModel:
         # Set inflection point at tipping year
         t0 = tipping_year
 
-        # Calculate adoption for each year
-        adoption = []
-        for year in years:
-            # Cost-adjusted steepness
-            year_advantage = tco_advantage.get(year, 0) if year in tco_advantage.index else 0
-            k = self.base_steepness_k0 + self.cost_sensitivity_s * max(0, year_advantage)
+        # Cost-adjusted steepness for every year at once (years without TCO data get no boost)
+        year_advantage = tco_advantage.reindex(years, fill_value=0).to_numpy(dtype=np.float64)
+        k = self.base_steepness_k0 + self.cost_sensitivity_s * np.where(year_advantage > 0, year_advantage, 0.0)
 
-            # Apply scenario acceleration factor
-            k *= adoption_acceleration
+        # Apply scenario acceleration factor
+        k *= adoption_acceleration
 
-            # Calculate S-curve value
-            share = self.ceiling_L / (1 + np.exp(-k * (year - t0)))
+        # Calculate S-curve values
+        adoption = self.ceiling_L / (1 + np.exp(-k * (np.asarray(years, dtype=np.float64) - t0)))
 
-            # Ensure monotonic increase (market doesn't regress)
-            if adoption and share < adoption[-1]:
-                share = adoption[-1]
-
-            adoption.append(share)
+        # Ensure monotonic increase (market doesn't regress)
+        adoption = np.maximum.accumulate(adoption)
 
         return pd.Series(adoption, index=years)
 
@@ -125,7 +119,10 @@ class AdoptionModel:
 
         if self.calibration_method == 'least_squares':
             try:
-                # Initial guess
+                # Initial guess, clipped into the bounds (curve_fit rejects an
+                # infeasible x0, e.g. a mid-history year before the t0 lower bound)
+                lower = [self.bounds['L'][0], self.bounds['t0'][0], self.bounds['k0'][0]]
+                upper = [self.bounds['L'][1], self.bounds['t0'][1], self.bounds['k0'][1]]
                 L_init = min(self.ceiling_L, shares.max() * 1.5)
                 t0_init = years[len(years) // 2]
                 k_init = self.base_steepness_k0
@@ -135,11 +132,8 @@ class AdoptionModel:
                     self.logistic_function,
                     years,
                     shares,
-                    p0=[L_init, t0_init, k_init],
-                    bounds=(
-                        [self.bounds['L'][0], self.bounds['t0'][0], self.bounds['k0'][0]],
-                        [self.bounds['L'][1], self.bounds['t0'][1], self.bounds['k0'][1]]
-                    ),
+                    p0=np.clip([L_init, t0_init, k_init], lower, upper),
+                    bounds=(lower, upper),
                     maxfev=5000
                 )
 
@@ -203,10 +197,10 @@ class AdoptionModel:
             L_est = self.ceiling_L
 
         # Estimate inflection point
-        # Find year closest to L/2
+        # Find first year at or above L/2
         half_ceiling = L_est / 2
-        closest_idx = np.argmin(np.abs(shares - half_ceiling))
-        if shares[closest_idx] < half_ceiling:
+        at_midpoint = np.flatnonzero(shares >= half_ceiling)
+        if at_midpoint.size == 0:
             # Haven't reached midpoint yet - project forward
             if len(shares) >= 2:
                 annual_growth = (shares[-1] - shares[-2])
@@ -218,11 +212,11 @@ class AdoptionModel:
             else:
                 t0_est = years[-1] + 10
         else:
-            t0_est = years[closest_idx]
+            t0_est = years[at_midpoint[0]]
 
         # Estimate steepness based on historical growth rate
         if len(shares) >= 2:
-            max_growth = max(shares[i+1] - shares[i] for i in range(len(shares)-1))
+            max_growth = np.diff(shares).max()
             k_est = min(1.5, max(0.1, max_growth * 10))
         else:
             k_est = self.base_steepness_k0
@@ -254,7 +248,7 @@ class AdoptionModel:
         residuals = shares - predicted
 
         # Get TCO advantages for historical years
-        advantages = [tco_advantage.get(year, 0) for year in years]
+        advantages = tco_advantage.reindex(years, fill_value=0).to_numpy(dtype=np.float64)
 
         if np.std(advantages) > 0:
             # Estimate sensitivity as correlation scaled by magnitude
@@ -290,25 +284,21 @@ class AdoptionModel:
         Returns:
             DataFrame with adoption projections for each scenario
         """
-        results = pd.DataFrame({'year': years})
-
-        for scenario_name, scenario_config in scenarios.items():
-            # Apply scenario modifications to base parameters
-            L = scenario_config.get('ceiling_L', base_params['L'])
-            t0 = scenario_config.get('midpoint_t0', base_params['t0'])
-            k0 = scenario_config.get('base_steepness_k0', base_params['k0'])
-            acceleration = scenario_config.get('adoption_acceleration', 1.0)
-
-            # Calculate adoption curve
-            adoption = []
-            for year in years:
-                k = k0 * acceleration
-                share = L / (1 + np.exp(-k * (year - t0)))
-                adoption.append(share)
-
-            results[scenario_name] = adoption
-
-        return results
+        # Scenario modifications to base parameters, one row per scenario
+        params = np.array([
+            (float(scenario_config.get('ceiling_L', base_params['L'])),
+             float(scenario_config.get('midpoint_t0', base_params['t0'])),
+             float(scenario_config.get('base_steepness_k0', base_params['k0'])),
+             float(scenario_config.get('adoption_acceleration', 1.0)))
+            for scenario_config in scenarios.values()
+        ]).reshape(-1, 4)
+        L, t0, k0, acceleration = params.T
+
+        # Adoption curves for all scenarios at once: (years x scenarios)
+        k = k0 * acceleration
+        adoption = L / (1 + np.exp(-k * (np.asarray(years, dtype=np.float64)[:, None] - t0)))
+
+        return pd.DataFrame({'year': years, **dict(zip(scenarios, adoption.T))})
 
     def calculate_market_shares(self, total_demand: pd.Series, lithium_adoption: pd.Series) -> Dict[str, pd.Series]:
         """
@@ -356,32 +346,30 @@ class AdoptionModel:
             'saturation_period': None
         }
 
-        # Find milestone years
-        for threshold, key in [(0.10, 'years_to_10pct'),
-                               (0.50, 'years_to_50pct'),
-                               (0.90, 'years_to_90pct')]:
-            for i, share in enumerate(shares):
-                if share >= threshold:
-                    metrics[key] = years[i]
-                    break
+        # Find milestone years (first year at or above each threshold)
+        thresholds = np.array([0.10, 0.50, 0.90])
+        reached = shares[:, None] >= thresholds
+        first_reached = reached.argmax(axis=0)
+        for key, hit, i in zip(['years_to_10pct', 'years_to_50pct', 'years_to_90pct'],
+                               reached.any(axis=0), first_reached):
+            if hit:
+                metrics[key] = years[i]
 
         # Calculate growth metrics
         if len(shares) > 1:
-            annual_growth = [shares[i+1] - shares[i] for i in range(len(shares)-1)]
-            metrics['max_annual_growth'] = max(annual_growth)
+            annual_growth = np.diff(shares)
+            metrics['max_annual_growth'] = annual_growth.max()
             metrics['average_annual_growth'] = np.mean(annual_growth)
 
             # Find acceleration period (growth increasing)
-            for i in range(len(annual_growth)-1):
-                if annual_growth[i+1] < annual_growth[i]:
-                    metrics['acceleration_period'] = (years[0], years[i+1])
-                    break
+            slowing = np.flatnonzero(annual_growth[1:] < annual_growth[:-1])
+            if slowing.size:
+                metrics['acceleration_period'] = (years[0], years[slowing[0] + 1])
 
             # Find saturation period (growth < 1% per year)
-            for i, growth in enumerate(annual_growth):
-                if growth < 0.01:
-                    metrics['saturation_period'] = (years[i], years[-1])
-                    break
+            saturated = np.flatnonzero(annual_growth < 0.01)
+            if saturated.size:
+                metrics['saturation_period'] = (years[saturated[0]], years[-1])
 
         return metrics
 
@@ -235,18 +235,16 @@ def validate_forecast_consistency(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check non-negative
-    if np.any(market < -epsilon):
-        return False, "Market demand has negative values"
-    if np.any(bev < -epsilon):
-        return False, "BEV demand has negative values"
-    if np.any(phev < -epsilon):
-        return False, "PHEV demand has negative values"
-    if np.any(ice < -epsilon):
-        return False, "ICE demand has negative values"
+    names = ("Market", "BEV", "PHEV", "ICE")
+    stacked = np.stack([market, bev, phev, ice])
+
+    # Check non-negative (one comparison over all series, first offender reported)
+    negative = np.any(stacked < -epsilon, axis=1)
+    if negative.any():
+        return False, f"{names[int(np.argmax(negative))]} demand has negative values"
 
     # Check sum constraint
-    total = bev + phev + ice
+    total = stacked[1:].sum(axis=0)
     if np.any(total > market + epsilon):
         max_violation = np.max(total - market)
         return False, f"Sum exceeds market by up to {max_violation:.2f}"
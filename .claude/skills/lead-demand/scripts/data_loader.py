@@ -6,8 +6,33 @@ Loads lead demand data and vehicle fleet data for SLI battery calculations
 import json
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+# Skill's local data/ folder, resolved once at import
+_DEFAULT_DATA_PATH = Path(__file__).resolve().parent.parent / 'data'
+
+
+@lru_cache(maxsize=16)
+def _read_json(path):
+    """
+    Parse a JSON file, memoized by absolute path for the life of the process
+
+    Scenario and sensitivity sweeps build a new LeadDataLoader per run;
+    they all share these parsed dicts, so callers must not mutate them.
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 
 class LeadDataLoader:
     """Loads and processes lead demand and vehicle data"""
@@ -20,10 +45,10 @@ class LeadDataLoader:
             base_data_path: Path to data directory (defaults to skill's local data/ folder)
         """
         if base_data_path is None:
-            skill_dir = Path(__file__).parent.parent
-            self.base_data_path = skill_dir / 'data'
+            self.base_data_path = _DEFAULT_DATA_PATH
         else:
-            self.base_data_path = Path(base_data_path)
+            # Absolute once here, so file paths below are already cache keys
+            self.base_data_path = Path(base_data_path).resolve()
 
         self.regions = ['China', 'USA', 'Europe', 'Rest_of_World', 'Global']
         self.taxonomy = None  # Loaded on demand
@@ -32,8 +57,7 @@ class LeadDataLoader:
         """Helper to load and parse JSON file"""
         filepath = self.base_data_path / filename
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            return _read_json(str(filepath))
         except FileNotFoundError:
             raise FileNotFoundError(f"Data file not found: {filepath}")
         except json.JSONDecodeError as e:
@@ -286,8 +310,7 @@ class LeadDataLoader:
         vehicle_file = self.base_data_path / f'{vehicle_type}.json'
 
         try:
-            with open(vehicle_file, 'r') as f:
-                data = json.load(f)
+            data = _read_json(str(vehicle_file))
         except FileNotFoundError:
             raise FileNotFoundError(f"Vehicle data file not found: {vehicle_file}")
 
@@ -730,17 +730,21 @@ class LeadDemandForecast:
         key_columns = ['total_lead_demand_kt', 'sli_demand_kt', 'industrial_demand_kt']
         anomalies_found = False
 
+        years = np.asarray(self.years)
+
         for col in key_columns:
             if col in self.results.columns:
-                # Calculate YoY growth rates
-                values = self.results[col].values
-                for i in range(1, len(values)):
-                    if values[i-1] > 0:
-                        growth_rate = ((values[i] / values[i-1]) - 1) * 100
-                        if abs(growth_rate) > 20:
-                            year = self.years[i]
-                            print(f"⚠️  WARNING: {col} YoY growth at year {year}: {growth_rate:+.1f}% (exceeds ±20% threshold)")
-                            anomalies_found = True
+                # Calculate YoY growth rates (0 where the previous year is not positive)
+                values = self.results[col].to_numpy(dtype=float)
+                prev = values[:-1]
+                growth_rates = np.divide(values[1:], prev, out=np.ones_like(prev), where=prev > 0)
+                growth_rates = (growth_rates - 1) * 100
+
+                # Only loop over the violations to print them
+                mask = np.abs(growth_rates) > 20
+                for year, growth_rate in zip(years[1:][mask], growth_rates[mask]):
+                    print(f"⚠️  WARNING: {col} YoY growth at year {year}: {growth_rate:+.1f}% (exceeds ±20% threshold)")
+                    anomalies_found = True
 
         if not anomalies_found:
             print("✓ PASS: All YoY growth rates within ±20% threshold")